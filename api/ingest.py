@@ -0,0 +1,77 @@
+"""Push endpoint: Readwise webhooks and batched document pushes"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from datetime import datetime
+from core.db_client import DatabaseClient
+from core.collector_manager import CollectorManager
+from core.ingest import IngestQueue, decode_body, ingest_readwise, push_documents, verify_push
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Kept for the life of a warm container so the dedup index is seeded once,
+# not on every webhook
+_manager = None
+
+
+def _get_manager() -> CollectorManager:
+    global _manager
+    if _manager is None:
+        _manager = CollectorManager(DatabaseClient())
+    return _manager
+
+
+def handler(request):
+    """Write pushed Reader documents without waiting for the next poll
+
+    Authenticated with INGEST_SECRET (HMAC of the body in X-Signature, or the
+    secret in X-Ingest-Secret / the payload's `secret` field).
+    """
+    if not isinstance(request, dict):
+        return {'statusCode': 400, 'body': {'error': 'Bad request'}}
+
+    try:
+        raw_body, payload = decode_body(request)
+    except Exception:
+        return {'statusCode': 400, 'body': {'error': 'Invalid JSON body'}}
+
+    if not verify_push(request.get('headers') or {}, raw_body, payload,
+                       os.environ.get('INGEST_SECRET')):
+        return {'statusCode': 403, 'body': {'error': 'Forbidden'}}
+
+    logger.info(f"Push ingest at {datetime.utcnow()}")
+
+    try:
+        manager = _get_manager()
+
+        source = manager.db.table('sources') \
+            .select('*') \
+            .eq('type', 'readwise') \
+            .eq('enabled', True) \
+            .limit(1) \
+            .execute()
+
+        if not getattr(source, 'data', None):
+            return {
+                'statusCode': 404,
+                'body': {'error': 'Readwise source not found or disabled'}
+            }
+
+        queue = IngestQueue(manager)
+        counts = ingest_readwise(queue, source.data[0], push_documents(payload))
+        counts['saved'] += queue.flush()
+
+        return {
+            'statusCode': 200,
+            'body': counts
+        }
+
+    except Exception as e:
+        logger.error(f"Push ingest failed: {e}")
+        return {
+            'statusCode': 500,
+            'body': {'error': str(e)}
+        }
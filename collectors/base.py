@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple
 from datetime import datetime
 from dataclasses import dataclass
+import requests  # type: ignore[import-untyped]
 
 
 @dataclass
@@ -23,11 +24,22 @@ class Article:
 class BaseCollector(ABC):
     """Abstract base class for all content collectors"""
 
-    def __init__(self, source_config: Dict[str, Any]):
+    def __init__(self, source_config: Dict[str, Any],
+                 session: Optional[requests.Session] = None,
+                 seen_ids: Optional[Set[str]] = None):
         self.source_id = source_config['id']
         self.source_name = source_config['name']
         self.config = source_config.get('config', {})
         self.sync_metadata = source_config.get('sync_metadata', {})
+        # Set by collect() when fetching was aborted by a source/network error
+        self.last_error: Optional[str] = None
+        # Shared session keeps connections alive across requests (and runs, in daemon mode)
+        self.session = session or requests.Session()
+        # IDs handled by earlier runs of a long-lived process (daemon mode), which a
+        # collector may skip without fetching; None when nothing is cached
+        self.seen_ids = seen_ids
+        # Set by collectors that use seen_ids: the set to keep once this run succeeds
+        self.updated_seen_ids: Optional[Set[str]] = None
 
     @abstractmethod
     def collect(self) -> Tuple[List[Article], Dict[str, Any]]:
@@ -1,11 +1,12 @@
 import logging
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Set, Tuple, Optional
 from datetime import datetime, timezone
 import time
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup
 
 from .base import BaseCollector, Article
+from .parse_pool import ParsePool
 
 
 logger = logging.getLogger(__name__)
@@ -15,6 +16,7 @@ class HackerNewsCollector(BaseCollector):
     """Collect stories from Hacker News API"""
 
     API_BASE = "https://hacker-news.firebaseio.com/v0"
+    ALGOLIA_BASE = "https://hn.algolia.com/api/v1"
     WEB_ITEM_BASE = "https://news.ycombinator.com/item?id="
 
     def validate_config(self) -> bool:
@@ -23,7 +25,11 @@ class HackerNewsCollector(BaseCollector):
 
     def test_connection(self) -> bool:
         try:
-            r = requests.get(f"{self.API_BASE}/.json", timeout=5)
+            if self._backend() == 'algolia':
+                r = self.session.get(f"{self._algolia_base()}/search",
+                                     params={'hitsPerPage': 0}, timeout=5)
+            else:
+                r = self.session.get(f"{self.API_BASE}/.json", timeout=5)
             return r.status_code == 200
         except Exception as e:
             logger.error(f"HN connection test failed: {e}")
@@ -33,11 +39,23 @@ class HackerNewsCollector(BaseCollector):
         """Fetch recent stories from HN.
 
         Config options (optional):
+        - backend: 'firebase' | 'algolia' (default: 'firebase')
+        - algolia_base: search API base URL (default: ALGOLIA_BASE)
         - list: 'new' | 'top' | 'best' (default: 'new')
         - max_items: int (default: 50)
+        - parse_mode / parse_workers / parse_batch_size: see ParsePool
+        - comments: bool, also crawl comment trees; firebase only (default: False)
+        - comment_max_depth: int (default: 2)
+        - comment_max_per_story: int (default: 50)
+        - comment_concurrency: int, parallel comment requests (default: 8)
+        - comment_request_budget: int, comment requests per run (default: 500)
         """
+        if self._backend() == 'algolia':
+            return self._collect_algolia()
+
         list_type = (self.config.get('list') or 'new').lower()
         max_items = int(self.config.get('max_items', 50))
+        crawl_comments = bool(self.config.get('comments', False))
 
         list_endpoint = {
             'new': 'newstories',
@@ -49,70 +67,255 @@ class HackerNewsCollector(BaseCollector):
             ids = self._get_story_ids(list_endpoint)
         except Exception as e:
             logger.error(f"Failed to fetch HN {list_endpoint}: {e}")
+            self.last_error = f"Failed to fetch HN {list_endpoint}: {e}"
             return [], self.sync_metadata
 
         # Incremental sync: filter by time > last_sync_unix (if present)
-        last_sync_unix = None
-        if 'last_sync_unix' in self.sync_metadata:
-            try:
-                last_sync_unix = int(self.sync_metadata['last_sync_unix'])
-            except Exception:
-                last_sync_unix = None
-
-        articles: List[Article] = []
+        last_sync_unix = self._last_sync_unix()
+
+        # Descendant counts from the previous sync; a story whose count has not
+        # changed has no new comments, so its subtree is not crawled again.
+        prev_descendants: Dict[str, Any] = self.sync_metadata.get('comment_descendants') or {}
+        descendants: Dict[str, Any] = {}
+        budget = {'remaining': int(self.config.get('comment_request_budget', 500))}
+
+        # Listed IDs already stored or filtered out in an earlier run are skipped
+        # before fetching. Comment mode must re-read stories to see new comments.
+        seen = self.seen_ids if self.seen_ids is not None and not crawl_comments else None
+        handled: Set[str] = {str(i) for i in ids} & seen if seen is not None else set()
+
+        # Fetch stage runs here; parsing/cleaning is handed to the parse pool
+        # so CPU work overlaps with the remaining item requests.
         fetched = 0
+        with ParsePool.from_config(self._parse_story, self.config) as pool, \
+                ThreadPoolExecutor(max_workers=int(self.config.get('comment_concurrency', 8))) as executor:
+            for story_id in ids:
+                if fetched >= max_items:
+                    break
+                if seen is not None and str(story_id) in seen:
+                    continue
+                item = self._get_item(story_id)
+                if not item:
+                    continue
+
+                if item.get('type') != 'story':
+                    handled.add(str(story_id))
+                    continue
 
-        for story_id in ids:
-            if fetched >= max_items:
-                break
-            item = self._get_item(story_id)
-            if not item:
-                continue
+                key = str(item.get('id'))
+                changed = key not in prev_descendants or \
+                    prev_descendants[key] != item.get('descendants')
+                if crawl_comments and key in prev_descendants:
+                    descendants[key] = prev_descendants[key]
+                    if not changed:
+                        continue
 
-            if item.get('type') != 'story':
-                continue
+                story_time = item.get('time') or 0
+                if last_sync_unix is not None and story_time <= last_sync_unix:
+                    # Skip older or equal items when doing incremental sync,
+                    # unless comment mode is tracking it and it has new comments
+                    if not (crawl_comments and key in prev_descendants):
+                        handled.add(str(story_id))
+                        continue
 
-            story_time = item.get('time') or 0
-            if last_sync_unix is not None and story_time <= last_sync_unix:
-                # Skip older or equal items when doing incremental sync
-                continue
+                if crawl_comments:
+                    if budget['remaining'] > 0:
+                        item['comment_items'], complete = self._crawl_comments(item, executor, budget)
+                        if complete:
+                            descendants[key] = item.get('descendants')
+                        elif key not in prev_descendants:
+                            # Cut short by the budget: a count that differs from the
+                            # story's (previous or None) gets it crawled again next run
+                            descendants[key] = None
+                    elif key in prev_descendants:
+                        # Budget spent on an already stored story: re-upserting it
+                        # would wipe its comment_tree, so keep the previous count
+                        # (set above) and re-crawl it next run
+                        continue
+                    else:
+                        # Budget spent on a new story: store it now, crawl its comments next run
+                        descendants[key] = None
 
-            article = self._parse_story(item)
-            if article:
-                articles.append(article)
+                pool.submit(item)
+                handled.add(str(story_id))
                 fetched += 1
 
+            articles = pool.results()
+
+        if seen is not None:
+            self.updated_seen_ids = handled
+
+        updated_sync = self._updated_sync(articles)
+
+        if crawl_comments:
+            # Only keep counts for stories still on the list to bound metadata size
+            listed = {str(i) for i in ids}
+            updated_sync['comment_descendants'] = {
+                k: v for k, v in descendants.items() if k in listed
+            }
+
+        logger.info(f"Collected {len(articles)} stories from Hacker News")
+        return articles, updated_sync
+
+    def _collect_algolia(self) -> Tuple[List[Article], Dict[str, Any]]:
+        """Fetch stories from the Algolia search API, many per request.
+
+        'new' pages through search_by_date; 'top' and 'best' both map to the
+        front_page tag. Incremental sync is pushed down to the server as a
+        created_at_i numeric filter.
+        """
+        list_type = (self.config.get('list') or 'new').lower()
+        max_items = int(self.config.get('max_items', 50))
+
+        if list_type == 'new':
+            endpoint, tags = 'search_by_date', 'story'
+        else:
+            endpoint, tags = 'search', 'front_page'
+
+        params: Dict[str, Any] = {
+            'tags': tags,
+            'hitsPerPage': min(max_items, 1000),
+        }
+        last_sync_unix = self._last_sync_unix()
+        if last_sync_unix is not None:
+            params['numericFilters'] = f"created_at_i>{last_sync_unix}"
+
+        fetched = 0
+        page = 0
+        with ParsePool.from_config(self._parse_story, self.config) as pool:
+            while fetched < max_items:
+                try:
+                    r = self.session.get(f"{self._algolia_base()}/{endpoint}",
+                                         params=dict(params, page=page), timeout=10)
+                    r.raise_for_status()
+                    data = r.json()
+                except Exception as e:
+                    logger.error(f"Failed to fetch HN search page {page}: {e}")
+                    self.last_error = f"Failed to fetch HN search page {page}: {e}"
+                    break
+
+                hits = data.get('hits') or []
+                for hit in hits[:max_items - fetched]:
+                    pool.submit(self._algolia_hit_to_item(hit))
+                    fetched += 1
+
+                page += 1
+                if not hits or page >= int(data.get('nbPages') or 0):
+                    break
+
+            articles = pool.results()
+
+        logger.info(f"Collected {len(articles)} stories from Hacker News (search)")
+        return articles, self._updated_sync(articles)
+
+    def _algolia_hit_to_item(self, hit: Dict[str, Any]) -> Dict[str, Any]:
+        """Reshape a search hit into the Firebase item fields _parse_story reads"""
+        return {
+            'id': int(hit['objectID']),
+            'type': 'story',
+            'title': hit.get('title'),
+            'url': hit.get('url'),
+            'by': hit.get('author'),
+            'time': hit.get('created_at_i'),
+            'score': hit.get('points'),
+            'descendants': hit.get('num_comments'),
+            'text': hit.get('story_text'),
+        }
+
+    def _backend(self) -> str:
+        return (self.config.get('backend') or 'firebase').lower()
+
+    def _algolia_base(self) -> str:
+        return (self.config.get('algolia_base') or self.ALGOLIA_BASE).rstrip('/')
+
+    def _last_sync_unix(self) -> Optional[int]:
+        if 'last_sync_unix' not in self.sync_metadata:
+            return None
+        try:
+            return int(self.sync_metadata['last_sync_unix'])
+        except Exception:
+            return None
+
+    def _updated_sync(self, articles: List[Article]) -> Dict[str, Any]:
         updated_sync = dict(self.sync_metadata)
         # Update sync time to current max time among collected or now
         if articles:
             max_story_time = max(int(item.published_at.replace(tzinfo=timezone.utc).timestamp())
                                  if item.published_at else int(time.time())
                                  for item in articles)
+            # Re-collected older stories (comment mode) must not move it backwards
+            previous = self._last_sync_unix()
+            if previous is not None:
+                max_story_time = max(previous, max_story_time)
             updated_sync['last_sync_unix'] = max_story_time
             updated_sync['last_story_count'] = len(articles)
         else:
             updated_sync['last_sync_unix'] = int(time.time())
-
-        logger.info(f"Collected {len(articles)} stories from Hacker News")
-        return articles, updated_sync
+        return updated_sync
 
     def _get_story_ids(self, list_endpoint: str) -> List[int]:
-        r = requests.get(f"{self.API_BASE}/{list_endpoint}.json", timeout=10)
+        r = self.session.get(f"{self.API_BASE}/{list_endpoint}.json", timeout=10)
         r.raise_for_status()
         data = r.json()
         if not isinstance(data, list):
             return []
         return [int(x) for x in data[:500]]  # hard cap for safety
 
+    def _get_max_item_id(self) -> int:
+        r = self.session.get(f"{self.API_BASE}/maxitem.json", timeout=10)
+        r.raise_for_status()
+        return int(r.json())
+
+    def _fetch_item(self, item_id: int) -> Optional[Dict[str, Any]]:
+        """Fetch an item; None means it does not exist, errors are raised"""
+        r = self.session.get(f"{self.API_BASE}/item/{item_id}.json", timeout=10)
+        r.raise_for_status()
+        return r.json()
+
     def _get_item(self, item_id: int) -> Optional[Dict[str, Any]]:
         try:
-            r = requests.get(f"{self.API_BASE}/item/{item_id}.json", timeout=10)
-            r.raise_for_status()
-            return r.json()
+            return self._fetch_item(item_id)
         except Exception as e:
             logger.warning(f"Failed to fetch HN item {item_id}: {e}")
             return None
 
+    def _crawl_comments(self, story: Dict[str, Any], executor: ThreadPoolExecutor,
+                        budget: Dict[str, int]) -> Tuple[List[Dict[str, Any]], bool]:
+        """Breadth-first crawl of a story's comments, level by level.
+
+        Bounded by comment_max_depth and comment_max_per_story, and by the
+        run-wide request budget shared across stories. Returns raw comment
+        fields with their depth (cleaning happens in the parse stage), and
+        False if the budget ran out before the crawl finished.
+        """
+        max_depth = int(self.config.get('comment_max_depth', 2))
+        max_comments = int(self.config.get('comment_max_per_story', 50))
+
+        comments: List[Dict[str, Any]] = []
+        frontier = [(kid, 1) for kid in story.get('kids') or []]
+        while frontier and len(comments) < max_comments and budget['remaining'] > 0:
+            level = frontier[:min(max_comments - len(comments), budget['remaining'])]
+            rest = frontier[len(level):]
+            budget['remaining'] -= len(level)
+
+            next_frontier = []
+            for (kid, depth), item in zip(level, executor.map(self._get_item, [k for k, _ in level])):
+                if not item or item.get('deleted') or item.get('dead'):
+                    continue
+                comments.append({
+                    'id': item.get('id'),
+                    'by': item.get('by'),
+                    'time': item.get('time'),
+                    'parent': item.get('parent'),
+                    'depth': depth,
+                    'text': item.get('text') or '',
+                })
+                if depth < max_depth:
+                    next_frontier.extend((k, depth + 1) for k in item.get('kids') or [])
+            frontier = rest + next_frontier
+
+        return comments, not frontier or len(comments) >= max_comments
+
     def _parse_story(self, item: Dict[str, Any]) -> Optional[Article]:
         try:
             title = item.get('title') or 'Untitled'
@@ -130,9 +333,15 @@ class HackerNewsCollector(BaseCollector):
                 'hn_permalink': f"{self.WEB_ITEM_BASE}{item.get('id')}",
                 'score': item.get('score'),
                 'comments': item.get('descendants'),
-                'kids': item.get('kids', []),
                 'source': 'hackernews'
             }
+            # Search hits carry no child IDs, so only the Firebase backend records kids
+            if self._backend() != 'algolia':
+                metadata['kids'] = item.get('kids', [])
+            if 'comment_items' in item:
+                metadata['comment_tree'] = [
+                    dict(c, text=self._clean_text(c['text'])) for c in item['comment_items']
+                ]
 
             return Article(
                 external_id=str(item.get('id')),
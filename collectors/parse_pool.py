@@ -0,0 +1,115 @@
+import logging
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .base import Article
+
+logger = logging.getLogger(__name__)
+
+
+ParseFn = Callable[[Dict[str, Any]], Optional[Article]]
+
+
+def _parse_batch(parse_fn: ParseFn, items: List[Dict[str, Any]]) -> List[Optional[Article]]:
+    """Parse one batch of raw payloads (module-level so process workers can unpickle it)"""
+    return [parse_fn(item) for item in items]
+
+
+class ParsePool:
+    """Parse stage for collectors: turns raw JSON payloads into Articles.
+
+    Collectors push raw payloads with ``submit`` while they are still fetching;
+    payloads are grouped into batches of ``batch_size`` so each task carries
+    enough work to amortize pickling when running on processes. ``results``
+    returns the parsed articles in submission order, whatever order workers
+    finish in.
+
+    Config options (on the source ``config``, all optional):
+    - parse_mode: 'inline' | 'thread' | 'process' (default: 'inline')
+    - parse_workers: int (default: executor default)
+    - parse_batch_size: int (default: 50)
+    """
+
+    MODES = ('inline', 'thread', 'process')
+    DEFAULT_BATCH_SIZE = 50
+
+    def __init__(self, parse_fn: ParseFn, mode: str = 'inline',
+                 max_workers: Optional[int] = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown parse mode: {mode}")
+        self.parse_fn = parse_fn
+        self.mode = mode
+        self.batch_size = max(1, int(batch_size))
+        self._executor: Optional[Executor] = None
+        if mode == 'thread':
+            self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        elif mode == 'process':
+            self._executor = ProcessPoolExecutor(max_workers=max_workers)
+        self._buffer: List[Dict[str, Any]] = []
+        # (Future or already-parsed list, raw batch), in submission order
+        self._pending: List[Tuple[Any, List[Dict[str, Any]]]] = []
+
+    @classmethod
+    def from_config(cls, parse_fn: ParseFn, config: Dict[str, Any]) -> 'ParsePool':
+        workers = config.get('parse_workers')
+        return cls(
+            parse_fn,
+            mode=(config.get('parse_mode') or 'inline').lower(),
+            max_workers=int(workers) if workers else None,
+            batch_size=int(config.get('parse_batch_size', cls.DEFAULT_BATCH_SIZE)),
+        )
+
+    def submit(self, item: Dict[str, Any]) -> None:
+        """Queue a raw payload; dispatches a batch once enough are buffered"""
+        self._buffer.append(item)
+        if len(self._buffer) >= self.batch_size:
+            self._dispatch()
+
+    def submit_many(self, items: List[Dict[str, Any]]) -> None:
+        for item in items:
+            self.submit(item)
+
+    def results(self) -> List[Article]:
+        """Flush pending payloads and return parsed articles in submission order"""
+        self._dispatch()
+        articles: List[Article] = []
+        for pending, raw in self._pending:
+            if isinstance(pending, Future):
+                try:
+                    batch = pending.result()
+                except Exception as e:
+                    # e.g. BrokenProcessPool: parse here rather than lose the items
+                    logger.warning(f"Parse batch failed on worker, parsing inline: {e}")
+                    batch = _parse_batch(self.parse_fn, raw)
+            else:
+                batch = pending
+            articles.extend(a for a in batch if a)
+        self._pending = []
+        return articles
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> 'ParsePool':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _dispatch(self) -> None:
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        if self._executor is None:
+            self._pending.append((_parse_batch(self.parse_fn, batch), batch))
+        else:
+            try:
+                future = self._executor.submit(_parse_batch, self.parse_fn, batch)
+            except Exception as e:
+                # A broken pool refuses new work; fall back to parsing here
+                logger.warning(f"Parse pool unavailable, parsing inline: {e}")
+                future = _parse_batch(self.parse_fn, batch)
+            self._pending.append((future, batch))
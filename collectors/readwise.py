@@ -3,6 +3,7 @@ from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import logging
 from .base import BaseCollector, Article
+from .parse_pool import ParsePool
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +21,7 @@ class ReadwiseCollector(BaseCollector):
         """Test Readwise API connectivity"""
         try:
             headers = {'Authorization': f"Token {self.config['api_token']}"}
-            response = requests.get(
+            response = self.session.get(
                 f"{self.API_BASE_URL}/auth/",
                 headers=headers,
                 timeout=5
@@ -31,11 +32,12 @@ class ReadwiseCollector(BaseCollector):
             return False
 
     def collect(self) -> Tuple[List[Article], Dict[str, Any]]:
-        """Fetch articles from Readwise Reader"""
-        articles: List[Article] = []
-        updated_sync_metadata = dict(self.sync_metadata)
+        """Fetch articles from Readwise Reader
 
-        headers = { 'Authorization': f"Token {self.config['api_token']}" }
+        Pages are fetched here while a ParsePool (configured via
+        parse_mode / parse_workers / parse_batch_size) extracts content.
+        """
+        updated_sync_metadata = dict(self.sync_metadata)
 
         params: Dict[str, Any] = {
             'withHtmlContent': 'true',  # Request full HTML per Reader API
@@ -57,28 +59,26 @@ class ReadwiseCollector(BaseCollector):
             limit = 1000
         total_fetched = 0
 
-        while next_url and total_fetched < limit:
-            try:
-                response = requests.get(
-                    next_url,
-                    headers=headers,
-                    params=params if next_url == f"{self.API_BASE_URL}/list/" else None,
-                    timeout=30
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                for item in data.get('results', []):
-                    article = self._parse_article(item)
-                    if article:
-                        articles.append(article)
-                        total_fetched += 1
-
-                next_url = data.get('next')
-
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Error fetching from Readwise: {e}")
-                break
+        with ParsePool.from_config(self._parse_article, self.config) as pool:
+            while next_url and total_fetched < limit:
+                try:
+                    data = self._fetch_page(
+                        next_url,
+                        params if next_url == f"{self.API_BASE_URL}/list/" else None
+                    )
+
+                    results = data.get('results', [])
+                    pool.submit_many(results)
+                    total_fetched += len(results)
+
+                    next_url = data.get('next')
+
+                except requests.exceptions.RequestException as e:
+                    logger.error(f"Error fetching from Readwise: {e}")
+                    self.last_error = f"Error fetching from Readwise: {e}"
+                    break
+
+            articles = pool.results()
 
         if articles:
             updated_sync_metadata['last_sync_date'] = datetime.utcnow().isoformat()
@@ -87,6 +87,13 @@ class ReadwiseCollector(BaseCollector):
         logger.info(f"Collected {len(articles)} articles from Readwise")
         return articles, updated_sync_metadata
 
+    def _fetch_page(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Fetch one page of the Reader list endpoint"""
+        headers = { 'Authorization': f"Token {self.config['api_token']}" }
+        response = self.session.get(url, headers=headers, params=params, timeout=30)
+        response.raise_for_status()
+        return response.json()
+
     def _parse_article(self, item: Dict[str, Any]) -> Optional[Article]:
         """Parse Readwise item into Article object"""
         try:
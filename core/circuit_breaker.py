@@ -0,0 +1,65 @@
+import time
+from typing import Any, Dict, Optional
+
+
+class CircuitBreaker:
+    """Per-source circuit breaker persisted in ``sync_metadata['circuit']``.
+
+    - healthy (no recorded failures): collect runs without a connection probe
+    - failing (below threshold): each run probes with test_connection first
+    - open: runs fail fast until ``open_until_unix``
+    - half-open (cooldown elapsed): one probed trial run; success closes the
+      circuit, failure reopens it with a doubled cooldown
+    """
+
+    FAILURE_THRESHOLD = 3
+    COOLDOWN_SECONDS = 15 * 60
+    MAX_COOLDOWN_SECONDS = 6 * 60 * 60
+
+    def __init__(self, failures: int = 0, open_until_unix: Optional[int] = None):
+        self.failures = failures
+        self.open_until_unix = open_until_unix
+
+    @classmethod
+    def from_sync_metadata(cls, sync_metadata: Optional[Dict[str, Any]]) -> 'CircuitBreaker':
+        state = (sync_metadata or {}).get('circuit') or {}
+        try:
+            failures = int(state.get('failures', 0))
+            open_until = state.get('open_until_unix')
+            return cls(failures, int(open_until) if open_until is not None else None)
+        except (TypeError, ValueError):
+            return cls()
+
+    def state(self, now: Optional[float] = None) -> str:
+        if self.failures < self.FAILURE_THRESHOLD:
+            return 'closed'
+        now = time.time() if now is None else now
+        if self.open_until_unix is not None and now < self.open_until_unix:
+            return 'open'
+        return 'half_open'
+
+    def allow_request(self, now: Optional[float] = None) -> bool:
+        return self.state(now) != 'open'
+
+    def should_probe(self) -> bool:
+        return self.failures > 0
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.open_until_unix = None
+
+    def record_failure(self, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        self.failures += 1
+        if self.failures >= self.FAILURE_THRESHOLD:
+            cooldown = min(
+                self.COOLDOWN_SECONDS * 2 ** (self.failures - self.FAILURE_THRESHOLD),
+                self.MAX_COOLDOWN_SECONDS
+            )
+            self.open_until_unix = int(now + cooldown)
+
+    def to_metadata(self) -> Optional[Dict[str, Any]]:
+        """Value for ``sync_metadata['circuit']``; None once healthy"""
+        if not self.failures:
+            return None
+        return {'failures': self.failures, 'open_until_unix': self.open_until_unix}
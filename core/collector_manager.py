@@ -1,8 +1,15 @@
+import hashlib
+import json
 import logging
-from typing import Dict, List, Type, Any
-from datetime import datetime
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Set, Type, Any, Optional, Tuple
+from datetime import datetime, timedelta
 import importlib
+import requests  # type: ignore[import-untyped]
 from collectors.base import BaseCollector, Article
+from core.circuit_breaker import CircuitBreaker
+from core.dedup import NearDuplicateDetector, duplicate_link
 
 logger = logging.getLogger(__name__)
 
@@ -15,9 +22,29 @@ class CollectorManager:
         'hackernews': 'collectors.hackernews.HackerNewsCollector',
     }
 
-    def __init__(self, db_client):
+    # Near-duplicate lookups compare new articles against this recent window,
+    # seeded with at most DEDUP_SEED_LIMIT of its newest signatures so start-up
+    # cost does not grow with the window
+    DEDUP_WINDOW_DAYS = 7
+    DEDUP_SEED_LIMIT = 5000
+    DEDUP_PAGE_SIZE = 1000
+    # Rows per contents upsert request
+    SAVE_BATCH_SIZE = 500
+    # Digests of the last rows written, so unchanged re-collected articles skip the upsert
+    WRITTEN_CACHE_SIZE = 50000
+
+    def __init__(self, db_client, session: Optional[requests.Session] = None,
+                 seen_ids: Optional[Dict[str, Set[str]]] = None):
         self.db = db_client
+        self.session = session
+        # Per-source IDs handled in earlier runs, kept by long-lived callers (daemon)
+        self.seen_ids = seen_ids
         self.collectors: Dict[str, Type[BaseCollector]] = {}
+        self.dedup = NearDuplicateDetector()
+        self._dedup_loaded = False
+        self._written: 'OrderedDict[tuple, str]' = OrderedDict()
+        # Set (e.g. from a signal handler) to stop after the in-flight source
+        self.stop_requested = threading.Event()
         self._load_collectors()
 
     def _load_collectors(self):
@@ -32,14 +59,20 @@ class CollectorManager:
             except Exception as e:
                 logger.warning(f"Failed to load collector {name}: {e}")
 
-    def collect_all_sources(self) -> Dict[str, Any]:
-        """Run collection for all enabled sources"""
-        sources_response = self.db.table('sources') \
-            .select('*') \
-            .eq('enabled', True) \
-            .execute()
+    def collect_all_sources(self, sources: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Run collection for all enabled sources
 
-        if not getattr(sources_response, 'data', None):
+        ``sources`` lets a caller that caches source rows skip the lookup;
+        rows are updated in place with what gets written back.
+        """
+        if sources is None:
+            sources_response = self.db.table('sources') \
+                .select('*') \
+                .eq('enabled', True) \
+                .execute()
+            sources = getattr(sources_response, 'data', None) or []
+
+        if not sources:
             logger.info("No enabled sources found")
             return {'sources_processed': 0, 'total_articles': 0}
 
@@ -51,7 +84,10 @@ class CollectorManager:
             'source_results': []
         }
 
-        for source in sources_response.data:
+        for source in sources:
+            if self.stop_requested.is_set():
+                logger.info("Stop requested; skipping remaining sources")
+                break
             source_result = self._collect_single_source(source)
             results['source_results'].append(source_result)
 
@@ -78,28 +114,61 @@ class CollectorManager:
             'error': None
         }
 
+        sync_metadata = source.get('sync_metadata') or {}
+        breaker = CircuitBreaker.from_sync_metadata(sync_metadata)
+        attempted = False
+
         try:
             if source['type'] not in self.collectors:
                 raise ValueError(f"No collector found for type: {source['type']}")
 
             collector_class = self.collectors[source['type']]
-            collector = collector_class(source)
+            known = self.seen_ids.get(source['id'], set()) if self.seen_ids is not None else None
+            collector = collector_class(source, session=self.session, seen_ids=known)
 
             if not collector.validate_config():
                 raise ValueError("Invalid source configuration")
 
-            if not collector.test_connection():
-                logger.warning(f"Connection test failed for {source['name']}")
+            if self._polled_recently(source):
+                # Push-fed source: polling only runs as a periodic reconciliation pass
+                source_result['status'] = 'skipped'
+                logger.info(f"Skipping {source['name']}: polled within poll_interval_seconds")
+                return source_result
+
+            if not breaker.allow_request():
+                source_result['status'] = 'circuit_open'
+                source_result['error'] = (
+                    f"Skipped {source['name']}: circuit open after "
+                    f"{breaker.failures} consecutive failures"
+                )
+                logger.warning(source_result['error'])
+                self._update_source(source, {
+                    'last_sync': datetime.utcnow().isoformat(),
+                    'last_sync_status': 'circuit_open'
+                })
+                return source_result
+
+            attempted = True
+            # Probe only when the source has recently failed (incl. half-open trials)
+            if breaker.should_probe() and not collector.test_connection():
+                raise ConnectionError("Connection test failed")
 
             articles, updated_sync_metadata = collector.collect()
+            if not articles and collector.last_error:
+                raise ConnectionError(collector.last_error)
+
+            saved_count = self.save_articles(articles, source['id'])
 
-            saved_count = self._save_articles(articles, source['id'])
+            breaker.record_success()
+            updated_sync_metadata.pop('circuit', None)
 
-            self.db.table('sources').update({
+            self._update_source(source, {
                 'last_sync': datetime.utcnow().isoformat(),
                 'last_sync_status': 'success',
                 'sync_metadata': updated_sync_metadata
-            }).eq('id', source['id']).execute()
+            })
+            if self.seen_ids is not None and collector.updated_seen_ids is not None:
+                self.seen_ids[source['id']] = collector.updated_seen_ids
 
             source_result['status'] = 'success'
             source_result['articles_collected'] = saved_count
@@ -112,43 +181,192 @@ class CollectorManager:
             error_msg = f"Failed to collect from {source['name']}: {str(e)}"
             logger.error(error_msg)
 
-            self.db.table('sources').update({
+            update: Dict[str, Any] = {
                 'last_sync': datetime.utcnow().isoformat(),
                 'last_sync_status': 'failed'
-            }).eq('id', source['id']).execute()
+            }
+            if attempted:
+                breaker.record_failure()
+                update['sync_metadata'] = dict(sync_metadata, circuit=breaker.to_metadata())
+
+            self._update_source(source, update)
 
             source_result['status'] = 'failed'
             source_result['error'] = error_msg
 
         return source_result
 
-    def _save_articles(self, articles: List[Article], source_id: str) -> int:
-        """Save articles to database"""
+    def _polled_recently(self, source: Dict[str, Any]) -> bool:
+        """True if the source sets poll_interval_seconds and last polled successfully within it
+
+        Failed and circuit_open runs also stamp last_sync, but must not delay
+        the retry (or the breaker's half-open trial) by a whole interval.
+        """
+        interval = int((source.get('config') or {}).get('poll_interval_seconds') or 0)
+        if not interval or not source.get('last_sync') or source.get('last_sync_status') != 'success':
+            return False
+        try:
+            last_sync = datetime.fromisoformat(str(source['last_sync']).replace('Z', '+00:00'))
+        except ValueError:
+            return False
+        if last_sync.tzinfo is not None:
+            last_sync = last_sync.replace(tzinfo=None) - last_sync.utcoffset()
+        return datetime.utcnow() - last_sync < timedelta(seconds=interval)
+
+    def _update_source(self, source: Dict[str, Any], fields: Dict[str, Any]):
+        """Write fields to the sources row and mirror them onto ``source``"""
+        self.db.table('sources').update(fields).eq('id', source['id']).execute()
+        source.update(fields)
+
+    def reset_dedup(self):
+        """Drop the near-duplicate index; it is re-seeded from the DB on the next save"""
+        self.dedup = NearDuplicateDetector()
+        self._dedup_loaded = False
+
+    def _load_recent_signatures(self):
+        """Seed the near-duplicate index with the newest signatures in the recent window
+
+        Loaded once per manager, so warm callers (daemon, ingest containers)
+        pay for it once; bounded by DEDUP_SEED_LIMIT rows.
+        """
+        if self._dedup_loaded:
+            return
+        self._dedup_loaded = True
+
+        cutoff = (datetime.utcnow() - timedelta(days=self.DEDUP_WINDOW_DAYS)).isoformat()
+        newest_first: List[Dict[str, Any]] = []
+        try:
+            while len(newest_first) < self.DEDUP_SEED_LIMIT:
+                start = len(newest_first)
+                size = min(self.DEDUP_PAGE_SIZE, self.DEDUP_SEED_LIMIT - start)
+                response = self.db.table('contents') \
+                    .select('source_id,external_id,minhash') \
+                    .gte('collected_at', cutoff) \
+                    .order('collected_at', desc=True) \
+                    .range(start, start + size - 1) \
+                    .execute()
+                rows = getattr(response, 'data', None) or []
+                newest_first.extend(rows)
+                if len(rows) < size:
+                    break
+        except Exception as e:
+            logger.warning(f"Failed to load recent signatures for dedup: {e}")
+
+        # Index oldest first: matches only link to rows indexed before them
+        rows_with_sig = [
+            r for r in reversed(newest_first)
+            if r.get('minhash') and len(r['minhash']) == self.dedup.num_perm
+        ]
+        if rows_with_sig:
+            self.dedup.add_many(
+                [(r['source_id'], r['external_id']) for r in rows_with_sig],
+                [r['minhash'] for r in rows_with_sig]
+            )
+
+        logger.info(f"Loaded {len(self.dedup)} recent signatures for near-duplicate detection")
+
+    def save_articles(self, articles: List[Article], source_id: str) -> int:
+        """Save articles to database
+
+        Rows are upserted SAVE_BATCH_SIZE at a time; if a batch is rejected its
+        rows are retried one by one so a bad row only loses itself. New
+        signatures are indexed as rows are built (so copies within a batch
+        link up) and dropped again if their row is not written.
+        """
         saved_count = 0
+        self._load_recent_signatures()
+
+        for start in range(0, len(articles), self.SAVE_BATCH_SIZE):
+            batch = articles[start:start + self.SAVE_BATCH_SIZE]
+            rows = []
+            digests = []
+            indexed = set()
+            for article in batch:
+                try:
+                    row, signature = self._article_row(article, source_id)
+                except Exception as e:
+                    logger.error(f"Failed to prepare article '{article.title}': {e}")
+                    continue
+                key = (source_id, article.external_id)
+                if signature is not None and key not in self.dedup:
+                    self.dedup.add(key, signature)
+                    indexed.add(key)
+                digest = self._row_digest(row)
+                if self._written.get(key) == digest:
+                    self._written.move_to_end(key)
+                    saved_count += 1  # Identical to the row already stored
+                    continue
+                rows.append(row)
+                digests.append((key, digest))
+            if not rows:
+                continue
 
-        for article in articles:
             try:
-                article_data = {
-                    'source_id': source_id,
-                    'external_id': article.external_id,
-                    'title': article.title,
-                    'url': article.url,
-                    'content': article.content,
-                    'author': article.author,
-                    'published_at': article.published_at.isoformat() if article.published_at else None,
-                    'metadata': article.metadata
-                }
-
                 self.db.table('contents').upsert(
-                    article_data,
+                    rows,
                     on_conflict='source_id,external_id'
                 ).execute()
-
-                saved_count += 1
-
+                saved_count += len(rows)
+                for key, digest in digests:
+                    self._remember_written(key, digest)
+                continue
             except Exception as e:
-                logger.error(f"Failed to save article '{article.title}': {e}")
+                logger.warning(f"Batch upsert of {len(rows)} articles failed, retrying per row: {e}")
+
+            failed = set()
+            for row, (key, digest) in zip(rows, digests):
+                link = row['metadata'].get('duplicate_of')
+                if link and (link['source_id'], link['external_id']) in failed:
+                    # Its original was never stored
+                    del row['metadata']['duplicate_of']
+                    digest = self._row_digest(row)
+                try:
+                    self.db.table('contents').upsert(
+                        row,
+                        on_conflict='source_id,external_id'
+                    ).execute()
+                    saved_count += 1
+                    self._remember_written(key, digest)
+                except Exception as e:
+                    logger.error(f"Failed to save article '{row['title']}': {e}")
+                    failed.add(key)
+                    if key in indexed:
+                        self.dedup.discard(key)
 
         return saved_count
 
-
+    @staticmethod
+    def _row_digest(row: Dict[str, Any]) -> str:
+        return hashlib.sha1(json.dumps(row, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    def _remember_written(self, key: tuple, digest: str):
+        self._written[key] = digest
+        self._written.move_to_end(key)
+        while len(self._written) > self.WRITTEN_CACHE_SIZE:
+            self._written.popitem(last=False)
+
+    def _article_row(self, article: Article, source_id: str) -> Tuple[Dict[str, Any], Any]:
+        """Build the contents row for an article, tagging near-duplicates
+
+        Returns the row and the content signature (None if unsigned); indexing
+        the signature is left to the caller.
+        """
+        key = (source_id, article.external_id)
+        signature = self.dedup.signature(article.content)
+        if signature is not None:
+            match = self.dedup.find(signature, exclude=key)
+            if match:
+                article.metadata['duplicate_of'] = duplicate_link(match)
+
+        row = {
+            'source_id': source_id,
+            'external_id': article.external_id,
+            'title': article.title,
+            'url': article.url,
+            'content': article.content,
+            'author': article.author,
+            'published_at': article.published_at.isoformat() if article.published_at else None,
+            'metadata': article.metadata,
+            'minhash': signature.tolist() if signature is not None else None
+        }
+        return row, signature
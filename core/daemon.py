@@ -0,0 +1,132 @@
+import logging
+import signal
+import threading
+import time
+from typing import Any, Dict, Optional, Set
+
+import requests  # type: ignore[import-untyped]
+
+from core.collector_manager import CollectorManager
+
+logger = logging.getLogger(__name__)
+
+
+class CollectorDaemon:
+    """Resident collection loop for self-hosted deployments.
+
+    The DB client, a shared HTTP session and the CollectorManager (with its
+    near-duplicate index, written-row cache and per-source seen IDs) stay
+    alive across cycles. Source rows are cached; each cycle reads only the
+    configuration columns of rows whose updated_at is past the newest one a
+    refresh query has returned. The watermark never moves on the daemon's
+    own writes, so an edit made while a cycle is running is still picked up.
+    Rows whose configuration is unchanged (the daemon's own sync writes also
+    bump updated_at) are ignored. Hand edits to other columns, and deleted
+    rows, are picked up every ``full_refresh_every`` cycles when the cache
+    is rebuilt from scratch; the dedup index is then re-seeded so it keeps
+    tracking the recent window.
+    """
+
+    # Columns read by the incremental refresh; a change to any of them
+    # (besides updated_at) counts as a configuration edit
+    CONFIG_FIELDS = ('name', 'type', 'enabled', 'config')
+
+    def __init__(self, db_client, interval_seconds: float = 3600,
+                 full_refresh_every: int = 24):
+        self.db = db_client
+        self.interval_seconds = interval_seconds
+        self.full_refresh_every = max(1, full_refresh_every)
+        self.session = requests.Session()
+        self.seen_ids: Dict[str, Set[str]] = {}
+        self.manager = CollectorManager(db_client, session=self.session, seen_ids=self.seen_ids)
+        self.sources: Dict[str, Dict[str, Any]] = {}
+        self.cycles = 0
+        self._watermark: Optional[str] = None
+        self._stop = threading.Event()
+
+    def request_stop(self, *_args) -> None:
+        """Finish the in-flight source (its writes included), then exit the loop"""
+        logger.info("Shutdown requested")
+        self._stop.set()
+        self.manager.stop_requested.set()
+
+    def refresh_sources(self) -> None:
+        if self.cycles % self.full_refresh_every == 0 or self._watermark is None:
+            response = self.db.table('sources').select('*').eq('enabled', True).execute()
+            rows = getattr(response, 'data', None) or []
+            previous, self.sources = self.sources, {row['id']: row for row in rows}
+            for source_id in list(self.seen_ids):
+                if self._config_changed(previous.get(source_id), self.sources.get(source_id)):
+                    del self.seen_ids[source_id]
+            self._advance_watermark(rows)
+            if self.cycles:
+                self.manager.reset_dedup()
+            logger.info(f"Loaded {len(self.sources)} enabled sources")
+        else:
+            response = self.db.table('sources') \
+                .select(','.join(('id', 'updated_at') + self.CONFIG_FIELDS)) \
+                .gt('updated_at', self._watermark) \
+                .execute()
+            changed = getattr(response, 'data', None) or []
+            picked_up = 0
+            for row in changed:
+                cached = self.sources.get(row['id'])
+                if not row.get('enabled'):
+                    if cached is None:
+                        continue
+                    del self.sources[row['id']]
+                elif cached is None:
+                    # New or re-enabled source: its sync state is not cached yet
+                    full = self.db.table('sources').select('*').eq('id', row['id']).execute()
+                    for source in getattr(full, 'data', None) or []:
+                        self.sources[source['id']] = source
+                elif self._config_changed(cached, row):
+                    cached.update({field: row.get(field) for field in self.CONFIG_FIELDS})
+                else:
+                    continue  # Only the daemon's own sync write moved updated_at
+                picked_up += 1
+                self.seen_ids.pop(row['id'], None)
+            if picked_up:
+                logger.info(f"Picked up {picked_up} changed sources")
+            self._advance_watermark(changed)
+
+    def run_cycle(self) -> Dict[str, Any]:
+        try:
+            self.refresh_sources()
+        except Exception as e:
+            logger.error(f"Failed to refresh sources, using cached config: {e}")
+
+        results = self.manager.collect_all_sources(list(self.sources.values()))
+        self.cycles += 1
+        return results
+
+    def run(self) -> None:
+        signal.signal(signal.SIGTERM, self.request_stop)
+        signal.signal(signal.SIGINT, self.request_stop)
+        logger.info(f"Collector daemon started (interval {self.interval_seconds}s)")
+
+        try:
+            while not self._stop.is_set():
+                started = time.monotonic()
+                try:
+                    results = self.run_cycle()
+                    logger.info(f"Cycle {self.cycles} completed: {results.get('sources_processed', 0)} "
+                                f"sources, {results.get('total_articles', 0)} articles")
+                except Exception as e:
+                    logger.error(f"Collection cycle failed: {e}")
+                self._stop.wait(max(0.0, self.interval_seconds - (time.monotonic() - started)))
+        finally:
+            self.session.close()
+            logger.info("Collector daemon stopped")
+
+    @classmethod
+    def _config_changed(cls, cached: Optional[Dict[str, Any]], row: Optional[Dict[str, Any]]) -> bool:
+        if cached is None or row is None:
+            return cached is not row
+        return any(cached.get(field) != row.get(field) for field in cls.CONFIG_FIELDS)
+
+    def _advance_watermark(self, rows) -> None:
+        for row in rows:
+            updated_at = row.get('updated_at')
+            if updated_at and (self._watermark is None or updated_at > self._watermark):
+                self._watermark = updated_at
@@ -0,0 +1,160 @@
+import re
+import zlib
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_WORD_RE = re.compile(r'\w+')
+
+# Mersenne prime 2^31 - 1: keeps every (a * h + b) product inside uint64
+_PRIME = np.uint64((1 << 31) - 1)
+
+
+class NearDuplicateDetector:
+    """Near-duplicate detection over article content using MinHash + LSH.
+
+    Content is tokenized into word shingles, each shingle hashed once and then
+    permuted ``num_perm`` times in a single NumPy broadcast; the row-wise minima
+    form the signature. Signatures are split into ``bands`` bands of
+    ``num_perm // bands`` rows and indexed by band hash, so a lookup only
+    compares against articles sharing at least one band instead of scanning
+    everything. Candidates are confirmed when the estimated Jaccard similarity
+    (fraction of equal signature slots) is at least ``threshold``.
+
+    Content shorter than ``min_words`` (default: three shingles) is not
+    signed: short boilerplate such as a bare "Comments" link would otherwise
+    match every other article carrying the same snippet.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, threshold: float = 0.8,
+                 shingle_size: int = 5, seed: int = 1, min_words: Optional[int] = None):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.min_words = 3 * shingle_size if min_words is None else min_words
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, int(_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(_PRIME), size=num_perm, dtype=np.uint64)
+        self._shingle_mult = np.uint64(rng.integers(1, int(_PRIME)))
+        # Band hashing wraps modulo 2^64; only equality of band keys matters
+        self._band_mult = rng.integers(1, np.iinfo(np.uint64).max, size=self.rows,
+                                       dtype=np.uint64)
+
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in range(bands)]
+        self._keys: List[Hashable] = []
+        self._positions: Dict[Hashable, int] = {}  # Insertion order, i.e. collection order
+        self._signatures: List[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._positions
+
+    def signature(self, text: Optional[str]) -> Optional[np.ndarray]:
+        """MinHash signature (uint32 array) for text, or None when it has fewer than min_words words"""
+        if not text:
+            return None
+        tokens = _WORD_RE.findall(_TAG_RE.sub(' ', text).lower())
+        if not tokens or len(tokens) < self.min_words:
+            return None
+
+        token_hashes = np.fromiter(
+            (zlib.crc32(t.encode('utf-8')) for t in tokens),
+            dtype=np.uint64, count=len(tokens)
+        ) % _PRIME
+
+        k = min(self.shingle_size, len(token_hashes))
+        n = len(token_hashes) - k + 1
+        shingles = token_hashes[:n].copy()
+        for j in range(1, k):
+            shingles = (shingles * self._shingle_mult + token_hashes[j:j + n]) % _PRIME
+        shingles = np.unique(shingles)
+
+        permuted = (self._a[:, None] * shingles[None, :] + self._b[:, None]) % _PRIME
+        return permuted.min(axis=1).astype(np.uint32)
+
+    def add(self, key: Hashable, signature: Sequence[int]) -> None:
+        self.add_many([key], [signature])
+
+    def add_many(self, keys: Iterable[Hashable], signatures: Sequence[Sequence[int]]) -> None:
+        """Index many signatures at once (band hashes are computed as one matrix)
+
+        Keys that are already indexed are skipped.
+        """
+        keys = list(keys)
+        matrix = np.asarray(signatures, dtype=np.uint32).reshape(len(keys), self.num_perm)
+        fresh = []
+        for i, key in enumerate(keys):
+            if key not in self._positions:
+                self._positions[key] = len(self._keys) + len(fresh)
+                fresh.append(i)
+        if not fresh:
+            return
+        keys = [keys[i] for i in fresh]
+        matrix = matrix[fresh]
+        band_keys = self._band_keys(matrix)
+        start = len(self._keys)
+        self._keys.extend(keys)
+        self._signatures.extend(matrix)
+        for offset, row in enumerate(band_keys.tolist()):
+            idx = start + offset
+            for band, band_key in enumerate(row):
+                self._buckets[band].setdefault(band_key, []).append(idx)
+
+    def discard(self, key: Hashable) -> None:
+        """Drop an indexed key from lookups (e.g. its row failed to write)"""
+        idx = self._positions.pop(key, None)
+        if idx is None:
+            return
+        row = self._band_keys(self._signatures[idx].reshape(1, self.num_perm))[0].tolist()
+        for band, band_key in enumerate(row):
+            bucket = self._buckets[band].get(band_key)
+            if bucket and idx in bucket:
+                bucket.remove(idx)
+                if not bucket:
+                    del self._buckets[band][band_key]
+
+    def find(self, signature: Sequence[int],
+             exclude: Optional[Hashable] = None) -> Optional[Tuple[Hashable, float]]:
+        """Best indexed match above threshold as (key, similarity), or None
+
+        If ``exclude`` is already indexed, only entries indexed before it are
+        considered, so re-checking a stored article never links it to a later
+        copy (which would itself point back at it).
+        """
+        sig = np.asarray(signature, dtype=np.uint32).reshape(1, self.num_perm)
+        candidates = set()
+        for band, band_key in enumerate(self._band_keys(sig)[0].tolist()):
+            candidates.update(self._buckets[band].get(band_key, ()))
+        limit = self._positions.get(exclude, len(self._keys)) if exclude is not None else len(self._keys)
+        candidates = [i for i in candidates if i < limit]
+        if not candidates:
+            return None
+
+        stacked = np.stack([self._signatures[i] for i in candidates])
+        similarities = (stacked == sig).mean(axis=1)
+        best = int(similarities.argmax())
+        if similarities[best] < self.threshold:
+            return None
+        return self._keys[candidates[best]], float(similarities[best])
+
+    def _band_keys(self, matrix: np.ndarray) -> np.ndarray:
+        bands = matrix.astype(np.uint64).reshape(len(matrix), self.bands, self.rows)
+        return (bands * self._band_mult).sum(axis=2, dtype=np.uint64)
+
+
+def duplicate_link(match: Tuple[Hashable, float]) -> Dict[str, Any]:
+    """Metadata value recorded under ``duplicate_of`` for a (source_id, external_id) match"""
+    (source_id, external_id), similarity = match
+    return {
+        'source_id': source_id,
+        'external_id': external_id,
+        'similarity': round(similarity, 3),
+    }
@@ -0,0 +1,113 @@
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from collectors.base import Article
+from collectors.readwise import ReadwiseCollector
+
+logger = logging.getLogger(__name__)
+
+
+class IngestQueue:
+    """Buffers pushed articles per source and writes them in micro-batches.
+
+    A batch is written once ``batch_size`` articles are queued for a source;
+    ``flush`` writes everything left. Batching only spans the documents of
+    one request, since a serverless request flushes before returning so
+    nothing is held in a container that may be frozen. The manager (and its
+    dedup index) can outlive the queue and be shared across requests.
+    """
+
+    def __init__(self, manager, batch_size: int = 100):
+        self.manager = manager
+        self.batch_size = batch_size
+        self._pending: Dict[str, List[Article]] = {}
+        self._lock = threading.Lock()
+
+    def put(self, source_id: str, articles: List[Article]) -> int:
+        """Queue articles; returns how many were written by this call"""
+        with self._lock:
+            queue = self._pending.setdefault(source_id, [])
+            queue.extend(articles)
+            saved = 0
+            while len(queue) >= self.batch_size:
+                batch, queue[:] = queue[:self.batch_size], queue[self.batch_size:]
+                saved += self.manager.save_articles(batch, source_id)
+            return saved
+
+    def flush(self) -> int:
+        with self._lock:
+            return sum(self._flush_source(source_id) for source_id in list(self._pending))
+
+    def _flush_source(self, source_id: str) -> int:
+        batch = self._pending.pop(source_id, [])
+        return self.manager.save_articles(batch, source_id) if batch else 0
+
+
+def verify_push(headers: Dict[str, Any], raw_body: Optional[bytes],
+                payload: Any, secret: Optional[str]) -> bool:
+    """Check a push request against the shared ingest secret.
+
+    Accepts an HMAC-SHA256 of the raw body in ``X-Signature`` (hex, optional
+    ``sha256=`` prefix), or the secret itself in ``X-Ingest-Secret`` or a
+    top-level ``secret`` field (how Readwise webhooks authenticate).
+    """
+    if not secret:
+        return False
+    headers = {str(k).lower(): v for k, v in (headers or {}).items()}
+
+    signature = headers.get('x-signature')
+    if signature and raw_body is not None:
+        expected = hmac.new(secret.encode('utf-8'), raw_body, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(str(signature).split('=', 1)[-1], expected)
+
+    provided = headers.get('x-ingest-secret')
+    if provided is None and isinstance(payload, dict):
+        provided = payload.get('secret')
+    return provided is not None and hmac.compare_digest(str(provided), secret)
+
+
+def decode_body(request: Dict[str, Any]) -> Tuple[Optional[bytes], Any]:
+    """Raw body bytes (when available) and decoded JSON from a handler request"""
+    body: Union[str, bytes, dict, list, None] = request.get('body')
+    if isinstance(body, (dict, list)):
+        return None, body
+    if body is None:
+        return None, None
+    if isinstance(body, str):
+        body = base64.b64decode(body) if request.get('isBase64Encoded') else body.encode('utf-8')
+    return body, json.loads(body.decode('utf-8'))
+
+
+def push_documents(payload: Any) -> List[Dict[str, Any]]:
+    """Documents in a push payload: a single document, a list, or a batch under results/documents"""
+    if isinstance(payload, list):
+        docs = payload
+    elif isinstance(payload, dict):
+        docs = payload.get('results') or payload.get('documents')
+        if docs is None:
+            docs = [payload] if 'id' in payload else []
+    else:
+        docs = []
+
+    documents = []
+    for doc in docs:
+        if not isinstance(doc, dict) or 'id' not in doc:
+            continue
+        if str(doc.get('event_type', '')).endswith('deleted'):
+            continue
+        documents.append(doc)
+    return documents
+
+
+def ingest_readwise(queue: IngestQueue, source: Dict[str, Any],
+                    documents: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Parse pushed Reader documents exactly as polling does and queue them for writing"""
+    collector = ReadwiseCollector(source)
+    articles = [a for a in map(collector._parse_article, documents) if a]
+    saved = queue.put(source['id'], articles)
+    return {'received': len(documents), 'parsed': len(articles), 'saved': saved}
@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
+import argparse
 import logging
+import os
 import sys
 from datetime import datetime
 from core.db_client import DatabaseClient
 from core.collector_manager import CollectorManager
+from core.daemon import CollectorDaemon
 
 # Configure logging
 logging.basicConfig(
@@ -15,6 +18,14 @@ logger = logging.getLogger(__name__)
 
 def main():
     """Main collection process"""
+    parser = argparse.ArgumentParser(description='Collect articles from enabled sources')
+    parser.add_argument('--daemon', action='store_true',
+                        help='keep running and collect on an internal schedule')
+    parser.add_argument('--interval', type=float,
+                        default=float(os.environ.get('COLLECT_INTERVAL_SECONDS', '3600')),
+                        help='seconds between daemon cycles (default: 3600)')
+    args = parser.parse_args()
+
     logger.info(f"Starting collection run at {datetime.utcnow()}")
 
     try:
@@ -24,6 +35,10 @@ def main():
             logger.error("Failed to connect to database")
             return 1
 
+        if args.daemon:
+            CollectorDaemon(db, interval_seconds=args.interval).run()
+            return 0
+
         manager = CollectorManager(db)
         results = manager.collect_all_sources()
 
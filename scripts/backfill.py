@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""Backfill historical items into contents
+
+Hacker News: the item-ID range below /maxitem is split into chunks that are
+fetched in parallel. Readwise: the full library is paged with the list
+endpoint's cursor (sequential by nature of the cursor).
+
+Progress is checkpointed to a JSON file after every write, so a stopped job
+(Ctrl-C) resumes where it left off when re-run with the same --checkpoint.
+HN fetches are retried with backoff; an ID that still fails holds its chunk's
+checkpoint at that ID, so a resume fetches it again.
+
+Examples:
+  python scripts/backfill.py hackernews --count 200000 --workers 8 --max-rps 20
+  python scripts/backfill.py readwise --max-rps 0.3
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+
+from collectors.base import Article
+from collectors.hackernews import HackerNewsCollector
+from collectors.readwise import ReadwiseCollector
+from core.collector_manager import CollectorManager
+from core.db_client import DatabaseClient
+
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DONE = 'done'
+DEFAULT_MAX_RPS = {'hackernews': 20.0, 'readwise': 0.3}  # Reader list API: 20 req/min
+
+
+def partition_ids(max_id: int, min_id: int, chunk_size: int) -> Dict[str, int]:
+    """Split [min_id, max_id] into "hi-lo" chunks, each mapped to its next ID (hi)"""
+    chunks: Dict[str, int] = {}
+    for hi in range(max_id, min_id - 1, -chunk_size):
+        lo = max(min_id, hi - chunk_size + 1)
+        chunks[f"{hi}-{lo}"] = hi  # Chunks walk downwards
+    return chunks
+
+
+class RateLimiter:
+    """Ceiling on request rate, shared by all worker threads"""
+
+    def __init__(self, max_rps: float):
+        self.interval = 1.0 / max_rps if max_rps > 0 else 0.0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class Checkpoint:
+    """Per-chunk cursors persisted to a JSON file (atomically replaced on save)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self.data: Dict[str, Any] = {'cursors': {}}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.data = json.load(f)
+
+    @property
+    def cursors(self) -> Dict[str, Any]:
+        return self.data['cursors']
+
+    def set(self, key: str, cursor: Any) -> None:
+        with self._lock:
+            self.cursors[key] = cursor
+            self._write()
+
+    def save(self) -> None:
+        with self._lock:
+            self._write()
+
+    def _write(self) -> None:
+        tmp = f"{self.path}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump(self.data, f)
+        os.replace(tmp, self.path)
+
+
+class Progress:
+    """Counts scanned/saved items and prints throughput and ETA periodically"""
+
+    def __init__(self, total: Optional[int], interval: float):
+        self.total = total
+        self.interval = interval
+        self.scanned = 0
+        self.saved = 0
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+
+    def add(self, scanned: int, saved: int = 0) -> None:
+        with self._lock:
+            self.scanned += scanned
+            self.saved += saved
+
+    def line(self) -> str:
+        elapsed = max(time.monotonic() - self._started, 1e-9)
+        rate = self.scanned / elapsed
+        text = f"{self.scanned} items scanned ({rate:.1f} items/s), {self.saved} saved"
+        if self.total:
+            remaining = max(self.total - self.scanned, 0)
+            eta = timedelta(seconds=int(remaining / rate)) if rate else 'unknown'
+            text += f", {self.scanned * 100 / self.total:.1f}% of {self.total}, ETA {eta}"
+        return text
+
+    def start(self) -> None:
+        def report():
+            while not self._done.wait(self.interval):
+                print(self.line(), flush=True)
+        threading.Thread(target=report, daemon=True).start()
+
+    def stop(self) -> None:
+        self._done.set()
+        print(self.line(), flush=True)
+
+
+class Backfill:
+    def __init__(self, manager: CollectorManager, source: Dict[str, Any], args: argparse.Namespace):
+        self.manager = manager
+        self.source = source
+        self.args = args
+        self.checkpoint = Checkpoint(args.checkpoint)
+        self.limiter = RateLimiter(args.max_rps)
+        self.progress = Progress(None, args.report_interval)
+        self.stop = threading.Event()
+        # Writes are serialized; the dedup index and DB client are shared
+        self._write_lock = threading.Lock()
+
+    def save(self, articles: List[Article]) -> int:
+        if not articles:
+            return 0
+        with self._write_lock:
+            return self.manager.save_articles(articles, self.source['id'])
+
+    def run_hackernews(self) -> None:
+        collector = HackerNewsCollector(self.source)
+        cursors = self.checkpoint.cursors
+        if not cursors:
+            max_id = collector._get_max_item_id()
+            min_id = self.args.min_id if self.args.min_id is not None \
+                else max(1, max_id - self.args.count + 1)
+            # The partition is fixed on the first run; resumes reuse it as stored
+            cursors.update(partition_ids(max_id, min_id, self.args.chunk_size))
+            self.checkpoint.save()
+
+        pending = []
+        for key, next_id in cursors.items():
+            lo = int(key.split('-')[1])
+            if next_id != DONE and next_id >= lo:
+                pending.append((key, next_id, lo))
+        self.progress.total = sum(next_id - lo + 1 for _, next_id, lo in pending)
+        print(f"Backfilling {self.progress.total} HN items in {len(pending)} chunks")
+
+        self._run_parallel(lambda chunk: self._hackernews_chunk(collector, *chunk), pending)
+
+    def _fetch_with_retry(self, collector: HackerNewsCollector, item_id: int):
+        """(fetched, item): item may be None for IDs that do not exist"""
+        for attempt in range(self.args.retries + 1):
+            if attempt:
+                delay = min(self.args.retry_backoff * 2 ** (attempt - 1), 60)
+                if self.stop.wait(delay):
+                    break
+            self.limiter.wait()
+            try:
+                return True, collector._fetch_item(item_id)
+            except Exception as e:
+                logger.warning(f"Failed to fetch HN item {item_id} (attempt {attempt + 1}): {e}")
+        return False, None
+
+    def _hackernews_chunk(self, collector: HackerNewsCollector, key: str, next_id: int, lo: int) -> None:
+        buffer: List[Article] = []
+        since_checkpoint = 0
+        item_id = next_id
+        # Highest ID that could not be fetched; the cursor never moves below it
+        failed_at: Optional[int] = None
+        while item_id >= lo and not self.stop.is_set():
+            fetched, item = self._fetch_with_retry(collector, item_id)
+            if not fetched and failed_at is None:
+                failed_at = item_id
+            item_id -= 1
+            since_checkpoint += 1
+            self.progress.add(1)
+
+            if item and item.get('type') == 'story' and not item.get('deleted') and not item.get('dead'):
+                article = collector._parse_story(item)
+                if article:
+                    buffer.append(article)
+
+            if len(buffer) >= self.args.batch_size or since_checkpoint >= self.args.checkpoint_every:
+                self.progress.add(0, self.save(buffer))
+                self.checkpoint.set(key, item_id if failed_at is None else failed_at)
+                buffer, since_checkpoint = [], 0
+
+        self.progress.add(0, self.save(buffer))
+        if failed_at is not None:
+            logger.error(f"Chunk {key} has unfetched IDs from {failed_at}; re-run to resume there")
+            self.checkpoint.set(key, failed_at)
+        else:
+            self.checkpoint.set(key, item_id if item_id >= lo else DONE)
+
+    def run_readwise(self) -> None:
+        collector = ReadwiseCollector(self.source)
+        first_page = f"{collector.API_BASE_URL}/list/"
+        cursor = self.checkpoint.cursors.get('library', first_page)
+        if cursor == DONE:
+            print("Readwise library already backfilled")
+            return
+        self._run_parallel(lambda _: self._readwise_pages(collector, first_page, cursor), [None])
+
+    def _readwise_pages(self, collector: ReadwiseCollector, first_page: str, cursor: str) -> None:
+        params: Dict[str, Any] = {'withHtmlContent': 'true'}
+        if self.args.location:
+            params['location'] = self.args.location
+
+        while cursor and not self.stop.is_set():
+            self.limiter.wait()
+            try:
+                data = collector._fetch_page(cursor, params if cursor == first_page else None)
+            except requests.exceptions.HTTPError as e:
+                if e.response is not None and e.response.status_code == 429:
+                    retry_after = int(e.response.headers.get('Retry-After', 60))
+                    print(f"Rate limited by Readwise, sleeping {retry_after}s", flush=True)
+                    self.stop.wait(retry_after)
+                    continue
+                logger.error(f"Error fetching from Readwise: {e}")
+                return
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Error fetching from Readwise: {e}")
+                return
+
+            if self.progress.total is None and data.get('count'):
+                self.progress.total = int(data['count'])
+
+            results = data.get('results', [])
+            articles = [a for a in map(collector._parse_article, results) if a]
+            self.progress.add(len(results), self.save(articles))
+
+            cursor = data.get('next')
+            self.checkpoint.set('library', cursor or DONE)
+
+    def _run_parallel(self, fn, chunks: List[Any]) -> None:
+        self.progress.start()
+        with ThreadPoolExecutor(max_workers=self.args.workers) as executor:
+            futures = [executor.submit(fn, chunk) for chunk in chunks]
+            try:
+                for future in futures:
+                    future.result()
+            except KeyboardInterrupt:
+                print("Stopping: flushing buffers and saving checkpoint...", flush=True)
+                self.stop.set()
+        self.progress.stop()
+
+
+def load_source(db: DatabaseClient, source_type: str, name: Optional[str]) -> Dict[str, Any]:
+    query = db.table('sources').select('*').eq('type', source_type)
+    if name:
+        query = query.eq('name', name)
+    rows = getattr(query.execute(), 'data', None) or []
+    if len(rows) != 1:
+        raise SystemExit(f"Expected one {source_type} source, found {len(rows)} (use --source-name)")
+    return rows[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Backfill historical items')
+    parser.add_argument('source', choices=['hackernews', 'readwise'])
+    parser.add_argument('--source-name', help='sources.name when several sources share a type')
+    parser.add_argument('--count', type=int, default=100000,
+                        help='HN: number of item IDs below /maxitem to scan')
+    parser.add_argument('--min-id', type=int, help='HN: lowest item ID to scan (overrides --count)')
+    parser.add_argument('--chunk-size', type=int, default=10000, help='HN: item IDs per chunk')
+    parser.add_argument('--workers', type=int, default=8, help='HN: chunks fetched in parallel')
+    parser.add_argument('--location', help='Readwise: only this location (default: whole library)')
+    parser.add_argument('--max-rps', type=float,
+                        help='request rate ceiling across all workers (0 = unlimited)')
+    parser.add_argument('--retries', type=int, default=5, help='HN: retries per failed item fetch')
+    parser.add_argument('--retry-backoff', type=float, default=1.0,
+                        help='HN: first retry delay in seconds, doubled per attempt')
+    parser.add_argument('--batch-size', type=int, default=200, help='articles per write')
+    parser.add_argument('--checkpoint-every', type=int, default=1000,
+                        help='HN: checkpoint at least every N scanned IDs')
+    parser.add_argument('--checkpoint', help='checkpoint file (default: backfill_<source>.checkpoint.json)')
+    parser.add_argument('--report-interval', type=float, default=10.0, help='seconds between reports')
+    args = parser.parse_args()
+
+    if args.max_rps is None:
+        args.max_rps = DEFAULT_MAX_RPS[args.source]
+    if args.checkpoint is None:
+        args.checkpoint = f"backfill_{args.source}.checkpoint.json"
+
+    db = DatabaseClient()
+    source = load_source(db, args.source, args.source_name)
+    backfill = Backfill(CollectorManager(db), source, args)
+
+    if args.source == 'hackernews':
+        backfill.run_hackernews()
+    else:
+        backfill.run_readwise()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Benchmark near-duplicate lookups against a large signature index"""
+import argparse
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from core.dedup import NearDuplicateDetector
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark MinHash/LSH dedup')
+    parser.add_argument('--stored', type=int, default=100_000)
+    parser.add_argument('--batch', type=int, default=1000)
+    args = parser.parse_args()
+
+    detector = NearDuplicateDetector()
+    rng = np.random.default_rng(0)
+    vocab = [f"w{i}" for i in range(50_000)]
+
+    # Stored signatures stand in for already-collected rows, as loaded from `contents.minhash`
+    stored = rng.integers(0, 2**31 - 1, size=(args.stored, detector.num_perm), dtype=np.uint32)
+    start = time.perf_counter()
+    detector.add_many((("src", str(i)) for i in range(args.stored)), stored)
+    print(f"Indexed {args.stored} signatures in {time.perf_counter() - start:.2f}s")
+
+    texts = [' '.join(rng.choice(vocab, size=400)) for _ in range(args.batch)]
+    start = time.perf_counter()
+    signatures = [detector.signature(t) for t in texts]
+    elapsed = time.perf_counter() - start
+    print(f"Signed {args.batch} 400-word texts in {elapsed:.2f}s "
+          f"({args.batch / elapsed:.0f} docs/s)")
+
+    # Plant one near-duplicate: same text with a few words replaced
+    words = texts[0].split()
+    words[::50] = ['edited'] * len(words[::50])
+    detector.add(('src', 'planted'), signatures[0])
+    near = detector.signature(' '.join(words))
+
+    start = time.perf_counter()
+    matches = sum(1 for sig in signatures[1:] if detector.find(sig))
+    elapsed = time.perf_counter() - start
+    print(f"Queried {args.batch - 1} signatures in {elapsed:.3f}s "
+          f"({elapsed / (args.batch - 1) * 1e6:.0f} us/query), false matches: {matches}")
+    print(f"Planted near-duplicate found: {detector.find(near)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -30,6 +30,9 @@ CREATE TABLE IF NOT EXISTS contents (
   UNIQUE(source_id, external_id)
 );
 
+-- MinHash signature per row for near-duplicate detection (see core/dedup.py)
+ALTER TABLE contents ADD COLUMN IF NOT EXISTS minhash INTEGER[];
+
 -- Track delivered content (used by intelligence service)
 CREATE TABLE IF NOT EXISTS delivered_content (
   id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
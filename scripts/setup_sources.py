@@ -20,6 +20,8 @@ def setup_sources():
                 'api_token': os.environ.get('READWISE_TOKEN'),
                 'location': 'feed',
                 'max_items': int(os.environ.get('READER_FEED_MAX_ITEMS', '100')),
+                # With webhooks pushing to /api/ingest, poll only as reconciliation
+                'poll_interval_seconds': int(os.environ.get('READER_POLL_INTERVAL_SECONDS', '0')),
             }
         },
         {
@@ -27,6 +29,7 @@ def setup_sources():
             'name': 'Hacker News',
             'enabled': True,
             'config': {
+                'backend': os.environ.get('HN_BACKEND', 'firebase'),
                 'list': os.environ.get('HN_LIST', 'top'),
                 'max_items': int(os.environ.get('HN_MAX_ITEMS', '50'))
             }
@@ -0,0 +1,118 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts'))
+
+import backfill  # noqa: E402
+from collectors.hackernews import HackerNewsCollector  # noqa: E402
+from core.collector_manager import CollectorManager  # noqa: E402
+from test_collector_manager import FakeDB  # noqa: E402
+
+SOURCE = {'id': 'hn', 'name': 'Hacker News', 'type': 'hackernews', 'config': {}, 'sync_metadata': {}}
+
+
+def _item(item_id):
+    if item_id % 4:
+        return {'id': item_id, 'type': 'comment', 'text': 'c'}
+    return {'id': item_id, 'type': 'story', 'title': f"s{item_id}", 'time': 1700000000 + item_id}
+
+
+class TestBackfillPieces(unittest.TestCase):
+    def test_partition_covers_range_without_overlap(self):
+        chunks = backfill.partition_ids(105, 81, 10)
+        self.assertEqual(chunks, {'105-96': 105, '95-86': 95, '85-81': 85})
+
+    def test_checkpoint_survives_reload(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'cp.json')
+            cp = backfill.Checkpoint(path)
+            cp.cursors.update(backfill.partition_ids(20, 1, 10))
+            cp.save()
+            cp.set('20-11', backfill.DONE)
+            cp.set('10-1', 4)
+            self.assertEqual(backfill.Checkpoint(path).cursors, {'20-11': 'done', '10-1': 4})
+            self.assertFalse(os.path.exists(f"{path}.tmp"))
+
+    def test_rate_limiter_spaces_requests(self):
+        limiter = backfill.RateLimiter(200)
+        started = time.monotonic()
+        for _ in range(11):
+            limiter.wait()
+        self.assertGreaterEqual(time.monotonic() - started, 10 / 200 * 0.9)
+
+        unlimited = backfill.RateLimiter(0)
+        started = time.monotonic()
+        for _ in range(1000):
+            unlimited.wait()
+        self.assertLess(time.monotonic() - started, 0.5)
+
+
+class TestHackerNewsBackfill(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = FakeDB([])
+        self.args = argparse.Namespace(
+            count=40, min_id=None, chunk_size=10, workers=2, max_rps=0, batch_size=3,
+            checkpoint_every=5, checkpoint=os.path.join(self.tmp.name, 'cp.json'),
+            report_interval=60, retries=2, retry_backoff=0, location=None)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _run(self, fetch):
+        job = backfill.Backfill(CollectorManager(self.db), SOURCE, self.args)
+        with mock.patch.object(HackerNewsCollector, '_get_max_item_id', return_value=100), \
+                mock.patch.object(HackerNewsCollector, '_fetch_item', autospec=True,
+                                  side_effect=lambda _self, i: fetch(i)):
+            job.run_hackernews()
+        return job
+
+    def _saved_ids(self):
+        return sorted(int(row['external_id']) for batch in self.db.upserts for row in batch)
+
+    def test_scans_all_chunks_and_resumes_nothing_when_done(self):
+        job = self._run(_item)
+        self.assertEqual(set(job.checkpoint.cursors.values()), {backfill.DONE})
+        self.assertEqual(self._saved_ids(), list(range(64, 101, 4)))
+
+        calls = []
+        self._run(lambda i: calls.append(i) or _item(i))
+        self.assertEqual(calls, [])
+
+    def test_transient_errors_are_retried(self):
+        failures = {77: 2}
+
+        def flaky(i):
+            if failures.get(i):
+                failures[i] -= 1
+                raise ConnectionError('blip')
+            return _item(i)
+
+        job = self._run(flaky)
+        self.assertEqual(set(job.checkpoint.cursors.values()), {backfill.DONE})
+        self.assertIn(76, self._saved_ids())
+
+    def test_failed_id_holds_checkpoint_and_is_refetched_on_resume(self):
+        def down(i):
+            if i == 76:
+                raise ConnectionError('down')
+            return _item(i)
+
+        job = self._run(down)
+        self.assertEqual(job.checkpoint.cursors['80-71'], 76)
+        self.assertNotIn(76, self._saved_ids())
+
+        calls = []
+        job = self._run(lambda i: calls.append(i) or _item(i))
+        self.assertEqual(calls, list(range(76, 70, -1)))
+        self.assertIn(76, self._saved_ids())
+        self.assertEqual(set(job.checkpoint.cursors.values()), {backfill.DONE})
+
+
+if __name__ == '__main__':
+    unittest.main()
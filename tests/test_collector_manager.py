@@ -0,0 +1,252 @@
+import unittest
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+from collectors.base import Article, BaseCollector
+from core.circuit_breaker import CircuitBreaker
+from core.collector_manager import CollectorManager
+from core.daemon import CollectorDaemon
+
+
+class FakeQuery:
+    """Chainable stand-in for a postgrest query; records writes on the FakeDB"""
+
+    def __init__(self, db: 'FakeDB', table: str):
+        self.db = db
+        self.table = table
+        self.op = 'select'
+        self.payload: Any = None
+        self.filters: Dict[str, Any] = {}
+        self.after: Dict[str, Any] = {}
+        self.bounds = None
+        self.ordering = None
+
+    def select(self, *args, **kwargs):
+        return self
+
+    def eq(self, column, value):
+        self.filters[column] = value
+        return self
+
+    def gte(self, *args):
+        return self
+
+    def gt(self, column, value):
+        self.after[column] = value
+        return self
+
+    def range(self, start, end):
+        self.bounds = (start, end)
+        return self
+
+    def order(self, column, desc=False):
+        self.ordering = (column, desc)
+        return self
+
+    def update(self, payload):
+        self.op, self.payload = 'update', payload
+        return self
+
+    def upsert(self, payload, **kwargs):
+        self.op, self.payload = 'upsert', payload
+        return self
+
+    def execute(self):
+        self.db.calls.append((self.table, self.op))
+        if self.op == 'select':
+            self.db.selects.append((self.table, dict(self.filters), dict(self.after)))
+            rows = [
+                dict(row) for row in self.db.rows.get(self.table, [])
+                if all(row.get(k) == v for k, v in self.filters.items())
+                and all(row.get(k, '') > v for k, v in self.after.items())
+            ]
+            if self.ordering:
+                column, desc = self.ordering
+                rows.sort(key=lambda row: row.get(column) or '', reverse=desc)
+            if self.bounds:
+                rows = rows[self.bounds[0]:self.bounds[1] + 1]
+            return SimpleNamespace(data=rows)
+        if self.op == 'update' and self.table == 'sources':
+            for row in self.db.rows['sources']:
+                if row['id'] == self.filters.get('id'):
+                    row.update(self.payload, updated_at=self.db.stamp())
+                    return SimpleNamespace(data=[dict(row)])
+        if self.op == 'upsert':
+            payload = self.payload if isinstance(self.payload, list) else [self.payload]
+            if any(row['external_id'] in self.db.reject for row in payload):
+                raise RuntimeError('row rejected')
+            self.db.upserts.append(self.payload)
+        return SimpleNamespace(data=[self.payload])
+
+
+class FakeDB:
+    def __init__(self, sources: List[Dict[str, Any]]):
+        self.rows: Dict[str, List[Dict[str, Any]]] = {'sources': sources, 'contents': []}
+        self.calls: List[tuple] = []
+        self.selects: List[tuple] = []
+        self.upserts: List[Any] = []
+        self.reject: set = set()  # external_ids whose upsert fails
+        self.clock = 0
+
+    def stamp(self) -> str:
+        """Monotonic stand-in for the updated_at trigger"""
+        self.clock += 1
+        return f"2026-01-01T00:00:{self.clock:02d}"
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+
+class FlakyCollector(BaseCollector):
+    """Collector whose source is up or down according to class flags"""
+    up = True
+    probes = 0
+    collects = 0
+
+    def validate_config(self) -> bool:
+        return True
+
+    def test_connection(self) -> bool:
+        FlakyCollector.probes += 1
+        return FlakyCollector.up
+
+    def collect(self):
+        FlakyCollector.collects += 1
+        if not FlakyCollector.up:
+            self.last_error = 'source down'
+            return [], self.sync_metadata
+        return [Article(external_id='1', title='t', content='hello world')], dict(self.sync_metadata)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        FlakyCollector.up = True
+        FlakyCollector.probes = FlakyCollector.collects = 0
+        self.source = {'id': 's1', 'name': 'Flaky', 'type': 'flaky', 'enabled': True,
+                       'config': {}, 'sync_metadata': {}}
+        self.db = FakeDB([self.source])
+        self.manager = CollectorManager(self.db)
+        self.manager.collectors['flaky'] = FlakyCollector
+
+    def _run(self):
+        return self.manager.collect_all_sources()['source_results'][0]['status']
+
+    def test_healthy_source_is_not_probed(self):
+        self.assertEqual(self._run(), 'success')
+        self.assertEqual(FlakyCollector.probes, 0)
+        self.assertNotIn('circuit', self.source['sync_metadata'])
+
+    def test_opens_after_threshold_then_half_open_trial_recovers(self):
+        FlakyCollector.up = False
+        statuses = [self._run() for _ in range(CircuitBreaker.FAILURE_THRESHOLD + 1)]
+        self.assertEqual(statuses[-2:], ['failed', 'circuit_open'])
+        # First failure came from collect(); later failing runs stop at the probe
+        self.assertEqual(FlakyCollector.collects, 1)
+        circuit = self.source['sync_metadata']['circuit']
+        self.assertEqual(circuit['failures'], CircuitBreaker.FAILURE_THRESHOLD)
+
+        # Cooldown elapses: half-open trial probes, collects and closes the circuit
+        circuit['open_until_unix'] = 0
+        FlakyCollector.up = True
+        self.assertEqual(self._run(), 'success')
+        self.assertNotIn('circuit', self.source['sync_metadata'])
+
+    def test_failed_trial_reopens_with_longer_cooldown(self):
+        breaker = CircuitBreaker(failures=CircuitBreaker.FAILURE_THRESHOLD, open_until_unix=100)
+        self.assertEqual(breaker.state(now=50), 'open')
+        self.assertEqual(breaker.state(now=100), 'half_open')
+        breaker.record_failure(now=100)
+        self.assertEqual(breaker.open_until_unix, 100 + 2 * CircuitBreaker.COOLDOWN_SECONDS)
+
+
+class TestCollectorDaemon(unittest.TestCase):
+    def setUp(self):
+        FlakyCollector.up = True
+        self.db = FakeDB([{'id': 'a', 'name': 'A', 'type': 'flaky', 'enabled': True,
+                           'config': {}, 'sync_metadata': {}, 'updated_at': '2026-01-01T00:00:00'}])
+        self.daemon = CollectorDaemon(self.db, interval_seconds=0)
+        self.daemon.manager.collectors['flaky'] = FlakyCollector
+
+    def test_incremental_source_refresh_and_warm_write_cache(self):
+        self.assertEqual(self.daemon.run_cycle()['sources_processed'], 1)
+        self.assertEqual(len(self.db.upserts), 1)
+
+        # Added after the first cycle: only rows newer than the watermark are fetched
+        self.db.rows['sources'].append({'id': 'b', 'name': 'B', 'type': 'flaky', 'enabled': True,
+                                        'config': {}, 'sync_metadata': {},
+                                        'updated_at': self.db.stamp()})
+        cached_a = self.daemon.sources['a']
+        self.assertEqual(self.daemon.run_cycle()['sources_processed'], 2)
+        _, filters, after = [sel for sel in self.db.selects if sel[0] == 'sources' and sel[2]][-1]
+        self.assertIn('updated_at', after)
+        self.assertNotIn('enabled', filters)
+        # A only changed through the daemon's own sync write, so its cached row is kept
+        self.assertIs(self.daemon.sources['a'], cached_a)
+        # A's unchanged article was not re-upserted; B's was written
+        self.assertEqual(len(self.db.upserts), 2)
+
+        self.db.rows['sources'][0].update(enabled=False, updated_at=self.db.stamp())
+        self.daemon.run_cycle()
+        self.assertEqual(set(self.daemon.sources), {'b'})
+
+    def test_config_edit_during_cycle_is_picked_up(self):
+        db = self.db
+        db.rows['sources'].append({'id': 'b', 'name': 'B', 'type': 'flaky', 'enabled': True,
+                                   'config': {}, 'sync_metadata': {}, 'updated_at': db.stamp()})
+
+        class EditingCollector(FlakyCollector):
+            def collect(self):
+                # Someone edits B while A is being collected
+                row = db.rows['sources'][1]
+                row.update(config={'v': 2}, updated_at=db.stamp())
+                return super().collect()
+
+        self.daemon.manager.collectors['editing'] = EditingCollector
+        db.rows['sources'][0]['type'] = 'editing'
+        self.daemon.run_cycle()
+        db.rows['sources'][0]['type'] = 'flaky'
+
+        self.daemon.run_cycle()
+        self.assertEqual(self.daemon.sources['b']['config'], {'v': 2})
+
+    def test_seen_ids_kept_across_cycles_until_config_changes(self):
+        class SeenCollector(FlakyCollector):
+            passed: List[Any] = []
+
+            def collect(self):
+                SeenCollector.passed.append(set(self.seen_ids))
+                self.updated_seen_ids = self.seen_ids | {str(len(SeenCollector.passed))}
+                return super().collect()
+
+        self.daemon.manager.collectors['seen'] = SeenCollector
+        self.db.rows['sources'][0]['type'] = 'seen'
+        self.daemon.run_cycle()
+        self.daemon.run_cycle()
+        self.db.rows['sources'][0].update(config={'list': 'top'}, updated_at=self.db.stamp())
+        self.daemon.run_cycle()
+        self.assertEqual(SeenCollector.passed, [set(), {'1'}, set()])
+
+    def test_stop_finishes_in_flight_source_only(self):
+        daemon = self.daemon
+
+        class StoppingCollector(FlakyCollector):
+            def collect(self):
+                daemon.request_stop()  # e.g. SIGTERM arriving mid-collection
+                return super().collect()
+
+        daemon.manager.collectors['stopping'] = StoppingCollector
+        self.db.rows['sources'][0]['type'] = 'stopping'
+        self.db.rows['sources'].append({'id': 'b', 'name': 'B', 'type': 'flaky', 'enabled': True,
+                                        'config': {}, 'sync_metadata': {}})
+
+        results = daemon.run_cycle()
+        self.assertEqual([r['source_name'] for r in results['source_results']], ['A'])
+        self.assertEqual(len(self.db.upserts), 1)
+        self.assertEqual(self.db.rows['sources'][0]['last_sync_status'], 'success')
+
+        daemon.run()  # Returns without another cycle once stopped
+        self.assertEqual(daemon.cycles, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
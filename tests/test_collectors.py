@@ -1,6 +1,26 @@
+import json
 import os
+import threading
 import unittest
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
 from collectors.base import Article
+from collectors.hackernews import HackerNewsCollector
+from collectors.parse_pool import ParsePool
+
+
+def _failed_future():
+    future = Future()
+    future.set_exception(BrokenProcessPool('worker died'))
+    return future
+
+
+def _hn_item(i):
+    return {'id': i, 'type': 'story', 'title': f's{i}', 'time': 1700000000 + i,
+            'text': f'<p>body {i}</p>'}
 
 
 class TestArticle(unittest.TestCase):
@@ -9,6 +29,228 @@ class TestArticle(unittest.TestCase):
         self.assertIsInstance(a.metadata, dict)
 
 
+class TestParsePool(unittest.TestCase):
+    def setUp(self):
+        self.collector = HackerNewsCollector({'id': 'src', 'name': 'HN'})
+
+    def _parse_ids(self, **kwargs):
+        items = [_hn_item(i) for i in range(23)]
+        with ParsePool(self.collector._parse_story, batch_size=4, **kwargs) as pool:
+            pool.submit_many(items)
+            return [a.external_id for a in pool.results()]
+
+    def test_modes_preserve_submission_order(self):
+        expected = [str(i) for i in range(23)]
+        for mode in ParsePool.MODES:
+            with self.subTest(mode=mode):
+                self.assertEqual(self._parse_ids(mode=mode, max_workers=2), expected)
+
+    def test_from_config_and_cleaning(self):
+        with ParsePool.from_config(self.collector._parse_story,
+                                   {'parse_mode': 'thread', 'parse_batch_size': 2}) as pool:
+            self.assertEqual(pool.batch_size, 2)
+            pool.submit(_hn_item(7))
+            (article,) = pool.results()
+        self.assertEqual(article.content, 'body 7')
+
+    def test_failed_worker_batch_is_parsed_inline(self):
+        with ParsePool(self.collector._parse_story, mode='thread', batch_size=2) as pool:
+            pool.submit_many([_hn_item(i) for i in range(3)])
+            with mock.patch.object(pool._executor, 'submit',
+                                   side_effect=lambda *a: _failed_future()):
+                pool.submit(_hn_item(3))
+            self.assertEqual([a.external_id for a in pool.results()], ['0', '1', '2', '3'])
+
+    def test_broken_pool_on_submit_is_parsed_inline(self):
+        with ParsePool(self.collector._parse_story, mode='thread', batch_size=1) as pool:
+            with mock.patch.object(pool._executor, 'submit',
+                                   side_effect=BrokenProcessPool('pool broken')):
+                pool.submit(_hn_item(5))
+            self.assertEqual([a.external_id for a in pool.results()], ['5'])
+
+    def test_unknown_mode_rejected(self):
+        with self.assertRaises(ValueError):
+            ParsePool(self.collector._parse_story, mode='gpu')
+
+
+class TestHackerNewsComments(unittest.TestCase):
+    # story 1 -> comments 10, 11; 10 -> 100 -> 1000 (depth 3)
+    ITEMS = {
+        1: {'id': 1, 'type': 'story', 'title': 's', 'time': 100, 'descendants': 4, 'kids': [10, 11]},
+        10: {'id': 10, 'type': 'comment', 'text': '<i>a</i>', 'parent': 1, 'kids': [100]},
+        11: {'id': 11, 'type': 'comment', 'deleted': True, 'parent': 1},
+        100: {'id': 100, 'type': 'comment', 'text': 'b', 'parent': 10, 'kids': [1000]},
+        1000: {'id': 1000, 'type': 'comment', 'text': 'c', 'parent': 100},
+    }
+
+    def _collect(self, config, sync_metadata=None):
+        collector = HackerNewsCollector({'id': 'src', 'name': 'HN', 'config': config,
+                                         'sync_metadata': sync_metadata or {}})
+        calls = []
+
+        def get_item(item_id):
+            calls.append(item_id)
+            return dict(self.ITEMS[item_id]) if item_id in self.ITEMS else None
+
+        with mock.patch.object(collector, '_get_story_ids', return_value=[1]), \
+                mock.patch.object(collector, '_get_item', side_effect=get_item):
+            articles, sync = collector.collect()
+        return articles, sync, calls
+
+    def test_crawl_respects_depth_and_cleans_text(self):
+        articles, sync, calls = self._collect({'comments': True, 'comment_max_depth': 2})
+        tree = articles[0].metadata['comment_tree']
+        self.assertEqual([(c['id'], c['depth'], c['text']) for c in tree], [(10, 1, 'a'), (100, 2, 'b')])
+        self.assertNotIn(1000, calls)
+        self.assertEqual(sync['comment_descendants'], {'1': 4})
+
+    def test_request_budget_bounds_crawl(self):
+        articles, sync, calls = self._collect({'comments': True, 'comment_request_budget': 1})
+        self.assertEqual(calls, [1, 10])
+        self.assertEqual(len(articles[0].metadata['comment_tree']), 1)
+        # Cut short: not recorded at its full count, so the next run finishes it
+        self.assertEqual(sync['comment_descendants'], {'1': None})
+
+        articles, sync, calls = self._collect({'comments': True}, sync)
+        self.assertEqual(len(articles[0].metadata['comment_tree']), 2)
+        self.assertEqual(sync['comment_descendants'], {'1': 4})
+
+    def test_partial_recrawl_keeps_previous_count(self):
+        articles, sync, calls = self._collect(
+            {'comments': True, 'comment_request_budget': 1},
+            {'last_sync_unix': 200, 'comment_descendants': {'1': 2}})
+        self.assertEqual(len(articles), 1)
+        self.assertEqual(sync['comment_descendants'], {'1': 2})
+
+    def test_recrawling_old_story_keeps_sync_watermark(self):
+        articles, sync, calls = self._collect(
+            {'comments': True}, {'last_sync_unix': 200, 'comment_descendants': {'1': 2}})
+        self.assertEqual(len(articles), 1)
+        self.assertEqual(sync['last_sync_unix'], 200)
+
+    def test_unchanged_story_is_skipped(self):
+        articles, sync, calls = self._collect(
+            {'comments': True}, {'last_sync_unix': 200, 'comment_descendants': {'1': 4}})
+        self.assertEqual(articles, [])
+        self.assertEqual(calls, [1])
+        self.assertEqual(sync['comment_descendants'], {'1': 4})
+
+    def test_changed_story_is_recrawled(self):
+        articles, sync, calls = self._collect(
+            {'comments': True}, {'last_sync_unix': 200, 'comment_descendants': {'1': 2}})
+        self.assertEqual(len(articles), 1)
+        self.assertEqual(sync['comment_descendants'], {'1': 4})
+
+    def test_stored_story_skipped_when_budget_spent(self):
+        articles, sync, calls = self._collect(
+            {'comments': True, 'comment_request_budget': 0},
+            {'last_sync_unix': 50, 'comment_descendants': {'1': 2}})
+        self.assertEqual(articles, [])
+        self.assertEqual(sync['comment_descendants'], {'1': 2})
+
+    def test_new_story_stored_without_comments_when_budget_spent(self):
+        articles, sync, calls = self._collect({'comments': True, 'comment_request_budget': 0})
+        self.assertEqual(len(articles), 1)
+        self.assertNotIn('comment_tree', articles[0].metadata)
+        self.assertEqual(sync['comment_descendants'], {'1': None})
+
+    def test_seen_ids_are_skipped_before_fetching(self):
+        collector = HackerNewsCollector({'id': 'src', 'name': 'HN', 'config': {}, 'sync_metadata': {}},
+                                        seen_ids={'1', '999'})
+        calls = []
+
+        def get_item(item_id):
+            calls.append(item_id)
+            return dict(self.ITEMS[item_id])
+
+        with mock.patch.object(collector, '_get_story_ids', return_value=[1, 10]), \
+                mock.patch.object(collector, '_get_item', side_effect=get_item):
+            articles, _ = collector.collect()
+        self.assertEqual(calls, [10])
+        self.assertEqual(articles, [])
+        # Unlisted IDs are dropped, so the set stays bounded by the list size
+        self.assertEqual(collector.updated_seen_ids, {'1', '10'})
+
+    def test_comments_off_by_default(self):
+        articles, sync, calls = self._collect({})
+        self.assertNotIn('comment_tree', articles[0].metadata)
+        self.assertEqual(calls, [1])
+
+
+class _SearchHandler(BaseHTTPRequestHandler):
+    """Stand-in for the Algolia HN search API: 5 stories, 2 per page"""
+    requests_seen = []
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        self.requests_seen.append((parsed.path, query))
+        # Like the real API, the server caps page size below what was asked for
+        page, per_page = int(query.get('page', 0)), max(1, min(int(query['hitsPerPage']), 2))
+        stories = [{'objectID': str(i), 'title': f's{i}', 'url': f'https://e.com/{i}',
+                    'author': 'pg', 'points': i, 'num_comments': 2 * i,
+                    'created_at_i': 1700000000 + i, 'story_text': '<p>hi</p>'}
+                   for i in range(5)]
+        body = {'hits': stories[page * per_page:(page + 1) * per_page],
+                'nbPages': (len(stories) + per_page - 1) // per_page}
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.end_headers()
+        self.wfile.write(json.dumps(body).encode())
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHackerNewsSearchBackend(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = HTTPServer(('127.0.0.1', 0), _SearchHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _SearchHandler.requests_seen = []
+
+    def _collector(self, config, sync_metadata=None):
+        return HackerNewsCollector({
+            'id': 'src', 'name': 'HN', 'sync_metadata': sync_metadata or {},
+            'config': dict(config, backend='algolia', algolia_base=self.base),
+        })
+
+    def test_pages_and_normalizes_to_article_shape(self):
+        collector = self._collector({'list': 'new', 'max_items': 3, 'parse_batch_size': 1})
+        articles, sync = collector.collect()
+
+        self.assertEqual([a.external_id for a in articles], ['0', '1', '2'])
+        self.assertEqual([p for p, _ in _SearchHandler.requests_seen], ['/search_by_date'] * 2)
+        self.assertEqual(_SearchHandler.requests_seen[0][1]['tags'], 'story')
+        a = articles[1]
+        self.assertEqual((a.title, a.url, a.author, a.content), ('s1', 'https://e.com/1', 'pg', 'hi'))
+        self.assertEqual(a.metadata['score'], 1)
+        self.assertEqual(a.metadata['comments'], 2)
+        self.assertNotIn('kids', a.metadata)
+        self.assertEqual(a.metadata['hn_permalink'], 'https://news.ycombinator.com/item?id=1')
+        self.assertEqual(sync['last_sync_unix'], 1700000002)
+
+    def test_follows_pages_with_created_at_filter(self):
+        collector = self._collector({'list': 'top', 'max_items': 10}, {'last_sync_unix': 1699999999})
+        self.assertTrue(collector.test_connection())
+        _SearchHandler.requests_seen = []
+        articles, _ = collector.collect()
+
+        self.assertEqual(len(articles), 5)
+        self.assertEqual([q['page'] for _, q in _SearchHandler.requests_seen], ['0', '1', '2'])
+        query = _SearchHandler.requests_seen[0][1]
+        self.assertEqual(query['tags'], 'front_page')
+        self.assertEqual(query['numericFilters'], 'created_at_i>1699999999')
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,122 @@
+import unittest
+from collectors.base import Article
+from core.collector_manager import CollectorManager
+from core.dedup import NearDuplicateDetector, duplicate_link
+from test_collector_manager import FakeDB
+
+
+BASE = ' '.join(f"word{i}" for i in range(300))
+
+
+class TestNearDuplicateDetector(unittest.TestCase):
+    def setUp(self):
+        self.detector = NearDuplicateDetector()
+
+    def test_signature_ignores_markup_and_case(self):
+        a = self.detector.signature(f"<p>{BASE.upper()}</p>")
+        b = self.detector.signature(BASE)
+        self.assertEqual(a.tolist(), b.tolist())
+        self.assertIsNone(self.detector.signature('<br/>'))
+
+    def test_short_boilerplate_is_not_signed(self):
+        self.assertIsNone(self.detector.signature('<a href="https://news.ycombinator.com/item?id=1">Comments</a>'))
+        self.assertIsNone(self.detector.signature(' '.join(BASE.split()[:self.detector.min_words - 1])))
+        self.assertIsNotNone(self.detector.signature(' '.join(BASE.split()[:self.detector.min_words])))
+
+    def test_finds_near_duplicate_and_excludes_self(self):
+        self.detector.add(('hn', '1'), self.detector.signature(BASE))
+        self.detector.add(('rw', '9'), self.detector.signature(
+            ' '.join(f"other{i}" for i in range(300))))
+
+        edited = BASE.replace('word150', 'changed')
+        match = self.detector.find(self.detector.signature(edited))
+        self.assertEqual(match[0], ('hn', '1'))
+        self.assertGreaterEqual(match[1], self.detector.threshold)
+        self.assertEqual(duplicate_link(match)['external_id'], '1')
+
+        self.assertIsNone(self.detector.find(self.detector.signature(BASE), exclude=('hn', '1')))
+
+    def test_indexed_key_only_matches_earlier_entries(self):
+        sig = self.detector.signature(BASE)
+        self.detector.add(('hn', '1'), sig)
+        self.detector.add(('rw', '2'), sig)
+        self.assertIsNone(self.detector.find(sig, exclude=('hn', '1')))
+        self.assertEqual(self.detector.find(sig, exclude=('rw', '2'))[0], ('hn', '1'))
+
+    def test_unrelated_content_not_matched(self):
+        self.detector.add(('hn', '1'), self.detector.signature(BASE))
+        sig = self.detector.signature(' '.join(f"token{i}" for i in range(300)))
+        self.assertIsNone(self.detector.find(sig))
+
+
+class TestManagerDedup(unittest.TestCase):
+    def setUp(self):
+        self.db = FakeDB([])
+        self.manager = CollectorManager(self.db)
+
+    def _save(self, source_id, external_id, content):
+        self.manager.save_articles([Article(external_id=external_id, title='t', content=content)],
+                                   source_id)
+        return self.db.upserts[-1][0]
+
+    def test_rows_carry_signature_and_duplicate_link(self):
+        first = self._save('hn', '1', BASE)
+        self.assertEqual(len(first['minhash']), self.manager.dedup.num_perm)
+        self.assertNotIn('duplicate_of', first['metadata'])
+
+        copy = self._save('rw', 'a', BASE.replace('word150', 'changed'))
+        self.assertEqual(copy['metadata']['duplicate_of']['source_id'], 'hn')
+        self.assertEqual(copy['metadata']['duplicate_of']['external_id'], '1')
+
+    def test_recollected_original_does_not_link_to_its_copy(self):
+        self._save('hn', '1', BASE)
+        self._save('rw', 'a', BASE.replace('word150', 'changed'))
+
+        again = self._save('hn', '1', BASE + ' updated')
+        self.assertNotIn('duplicate_of', again['metadata'])
+        copy_again = self._save('rw', 'a', BASE.replace('word150', 'changed') + ' edit')
+        self.assertEqual(copy_again['metadata']['duplicate_of']['external_id'], '1')
+
+    def test_seed_from_db_is_ordered_by_collection_time(self):
+        self.db.rows['contents'] = [
+            {'source_id': 'hn', 'external_id': '1', 'collected_at': '2026-01-01T00:00:01',
+             'minhash': self.manager.dedup.signature(BASE).tolist()},
+            {'source_id': 'rw', 'external_id': 'a', 'collected_at': '2026-01-01T00:00:02',
+             'minhash': self.manager.dedup.signature(BASE).tolist()},
+        ]
+        copy = self._save('rw', 'a', BASE)
+        self.assertEqual(copy['metadata']['duplicate_of']['external_id'], '1')
+
+    def test_seed_is_bounded_to_newest_rows(self):
+        self.manager.DEDUP_SEED_LIMIT, self.manager.DEDUP_PAGE_SIZE = 3, 2
+        self.db.rows['contents'] = [
+            {'source_id': 'hn', 'external_id': str(i), 'collected_at': f"2026-01-01T00:00:{i:02d}",
+             'minhash': self.manager.dedup.signature(f"{BASE} extra{i}").tolist()}
+            for i in range(10)
+        ]
+        self._save('rw', 'a', 'unrelated')
+        self.assertEqual(len([s for s in self.db.selects if s[0] == 'contents']), 2)
+        self.assertEqual(len(self.manager.dedup), 3)
+        self.assertIn(('hn', '9'), self.manager.dedup)
+        self.assertNotIn(('hn', '0'), self.manager.dedup)
+
+    def test_short_boilerplate_is_not_linked(self):
+        self._save('rw', 'a', '<a href="https://news.ycombinator.com/item?id=1">Comments</a>')
+        row = self._save('rw', 'b', '<a href="https://news.ycombinator.com/item?id=2">Comments</a>')
+        self.assertNotIn('duplicate_of', row['metadata'])
+        self.assertIsNone(row['minhash'])
+
+    def test_unwritten_row_is_not_linked_to(self):
+        self.db.reject.add('1')
+        self.assertEqual(self.manager.save_articles(
+            [Article(external_id='1', title='t', content=BASE),
+             Article(external_id='2', title='t', content=BASE)], 'hn'), 1)
+        self.assertNotIn('duplicate_of', self.db.upserts[-1]['metadata'])
+        self.assertNotIn(('hn', '1'), self.manager.dedup)
+
+        later = self._save('rw', 'a', BASE)
+        self.assertEqual(later['metadata']['duplicate_of']['external_id'], '2')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import hashlib
+import hmac
+import json
+import unittest
+from datetime import datetime, timedelta
+
+from core.collector_manager import CollectorManager
+from core.ingest import IngestQueue, decode_body, ingest_readwise, push_documents, verify_push
+from test_collector_manager import FakeDB, FlakyCollector
+
+SOURCE = {'id': 'rw', 'name': 'Readwise Reader', 'type': 'readwise', 'enabled': True,
+          'config': {'api_token': 'x'}, 'sync_metadata': {}}
+
+
+def _doc(i, **extra):
+    return dict({'id': f"doc{i}", 'title': f"t{i}", 'url': f"https://e.com/{i}",
+                 'content': f"  body {i}  \n\n"}, **extra)
+
+
+class TestPushVerification(unittest.TestCase):
+    def test_hmac_signature(self):
+        body = json.dumps({'results': [_doc(1)]}).encode()
+        sig = hmac.new(b's3cret', body, hashlib.sha256).hexdigest()
+        raw, payload = decode_body({'body': body.decode()})
+        self.assertTrue(verify_push({'X-Signature': f"sha256={sig}"}, raw, payload, 's3cret'))
+        self.assertFalse(verify_push({'X-Signature': 'sha256=00'}, raw, payload, 's3cret'))
+
+    def test_shared_secret_and_missing_config(self):
+        payload = {'secret': 's3cret', **_doc(1)}
+        self.assertTrue(verify_push({}, None, payload, 's3cret'))
+        self.assertFalse(verify_push({'x-ingest-secret': 'nope'}, None, payload, 's3cret'))
+        self.assertFalse(verify_push({}, None, payload, None))
+
+
+class TestIngest(unittest.TestCase):
+    def setUp(self):
+        self.db = FakeDB([dict(SOURCE)])
+        self.queue = IngestQueue(CollectorManager(self.db), batch_size=2)
+
+    def test_payload_shapes(self):
+        self.assertEqual(len(push_documents(_doc(1))), 1)
+        self.assertEqual(len(push_documents([_doc(1), _doc(2)])), 2)
+        deleted = _doc(3, event_type='reader.document.deleted')
+        self.assertEqual(len(push_documents({'documents': [_doc(1), deleted, 'junk']})), 1)
+
+    def test_parses_like_polling_and_writes_micro_batches(self):
+        counts = ingest_readwise(self.queue, SOURCE, push_documents([_doc(i) for i in range(5)]))
+        self.assertEqual(counts, {'received': 5, 'parsed': 5, 'saved': 4})
+        self.assertEqual([len(batch) for batch in self.db.upserts], [2, 2])
+        self.assertEqual(self.queue.flush(), 1)
+        row = self.db.upserts[0][0]
+        self.assertEqual(row['content'], 'body 0')
+        self.assertEqual(row['external_id'], 'doc0')
+
+    def test_shared_manager_seeds_dedup_once(self):
+        for i in range(3):
+            queue = IngestQueue(self.queue.manager, batch_size=2)
+            ingest_readwise(queue, SOURCE, push_documents([_doc(i)]))
+            queue.flush()
+        seeds = [sel for sel in self.db.selects if sel[0] == 'contents']
+        self.assertEqual(len(seeds), 1)
+        self.assertEqual(len(self.db.upserts), 3)
+
+    def test_recent_poll_is_skipped_for_push_fed_source(self):
+        manager = CollectorManager(self.db)
+        manager.collectors['readwise'] = FlakyCollector
+        source = dict(SOURCE, config={'poll_interval_seconds': 3600}, last_sync_status='success',
+                      last_sync=(datetime.utcnow() - timedelta(minutes=5)).isoformat())
+        self.assertEqual(manager._collect_single_source(source)['status'], 'skipped')
+        source['last_sync'] = (datetime.utcnow() - timedelta(hours=2)).isoformat()
+        self.assertEqual(manager._collect_single_source(source)['status'], 'success')
+
+    def test_failed_poll_is_retried_within_interval(self):
+        manager = CollectorManager(self.db)
+        manager.collectors['readwise'] = FlakyCollector
+        FlakyCollector.up = False
+        try:
+            source = dict(SOURCE, config={'poll_interval_seconds': 3600})
+            self.assertEqual(manager._collect_single_source(source)['status'], 'failed')
+            FlakyCollector.up = True
+            self.assertEqual(manager._collect_single_source(source)['status'], 'success')
+            self.assertEqual(manager._collect_single_source(source)['status'], 'skipped')
+        finally:
+            FlakyCollector.up = True
+
+
+if __name__ == '__main__':
+    unittest.main()
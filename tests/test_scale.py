@@ -0,0 +1,286 @@
+"""Synthetic scale test for CollectorManager
+
+Runs the manager over N generated sources with M items each, backed by an
+in-process collector type and a DB fake that only counts calls (and serves
+a previous window of stored signatures to the dedup seed), and checks that
+run time, peak memory, DB round trips and log volume grow no faster than
+linearly. Memory is checked with tracemalloc in-process; peak RSS
+is a process-lifetime figure, so it is only compared across sizes run in
+separate processes (run_scale_isolated). Set SCALE_TEST_LARGE=1 to also run
+thousands of sources, or run directly for a larger report:
+
+    SCALE_TEST_LARGE=1 python -m pytest tests/test_scale.py
+    python -m tests.test_scale 400 100
+"""
+import logging
+import math
+import os
+import random
+import resource
+import sys
+import time
+import tracemalloc
+import unittest
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from collectors.base import Article, BaseCollector
+from core.collector_manager import CollectorManager
+
+WORDS = [f"w{i}" for i in range(20000)]
+
+
+class SyntheticCollector(BaseCollector):
+    """Generates config['items'] distinct articles per run without I/O"""
+
+    def validate_config(self) -> bool:
+        return True
+
+    def collect(self):
+        rng = random.Random(self.source_id)
+        articles = [
+            Article(
+                external_id=f"{self.source_id}-{i}",
+                title=f"Story {i}",
+                url=f"https://example.com/{self.source_id}/{i}",
+                content=' '.join(rng.choices(WORDS, k=120)),
+                metadata={'rank': i},
+            )
+            for i in range(int(self.config['items']))
+        ]
+        return articles, dict(self.sync_metadata, last_count=len(articles))
+
+
+class CountingQuery:
+    def __init__(self, db: 'CountingDB', table: str):
+        self.db = db
+        self.table = table
+        self.op = 'select'
+        self.bounds = (0, 0)
+
+    def __getattr__(self, name):
+        # Filters/ordering are irrelevant to the counts
+        return lambda *args, **kwargs: self
+
+    def range(self, start, end):
+        self.bounds = (start, end)
+        return self
+
+    def update(self, payload):
+        self.op = 'update'
+        return self
+
+    def upsert(self, payload, **kwargs):
+        self.op = 'upsert'
+        self.db.rows_written += len(payload) if isinstance(payload, list) else 1
+        return self
+
+    def execute(self):
+        self.db.calls[(self.table, self.op)] += 1
+        if self.table == 'sources' and self.op == 'select':
+            return SimpleNamespace(data=self.db.sources)
+        if self.table == 'contents' and self.op == 'select':
+            return SimpleNamespace(data=self.db.stored_page(*self.bounds))
+        return SimpleNamespace(data=[])
+
+
+class CountingDB:
+    """DB fake that keeps no rows, so memory measured is the manager's own
+
+    ``stored`` rows with random signatures stand in for the dedup window;
+    pages of them are generated on demand.
+    """
+
+    def __init__(self, sources: List[Dict[str, Any]], stored: int = 0):
+        self.sources = sources
+        self.stored = stored
+        self.calls: Counter = Counter()
+        self.rows_written = 0
+
+    def stored_page(self, start: int, end: int) -> List[Dict[str, Any]]:
+        end = min(end + 1, self.stored)
+        if start >= end:
+            return []
+        signatures = np.random.default_rng(start).integers(0, 2**31, size=(end - start, 64))
+        return [{'source_id': 'stored', 'external_id': str(start + i), 'minhash': sig}
+                for i, sig in enumerate(signatures.tolist())]
+
+    def table(self, name: str) -> CountingQuery:
+        return CountingQuery(self, name)
+
+
+class _CountingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.INFO)
+        self.records = 0
+
+    def emit(self, record):
+        self.records += 1
+
+
+def _peak_rss_kb() -> int:
+    """Peak RSS of this process image
+
+    On Linux ru_maxrss of a spawned child also covers the parent's RSS when
+    it forked, so read the address space's own high-water mark instead.
+    """
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def run_scale(n_sources: int, items_per_source: int,
+              stored: Optional[int] = None) -> Dict[str, Any]:
+    """One collection run; ``stored`` defaults to one previous run's worth of rows"""
+    sources = [
+        {'id': f"src{i}", 'name': f"Synthetic {i}", 'type': 'synthetic', 'enabled': True,
+         'config': {'items': items_per_source}, 'sync_metadata': {}}
+        for i in range(n_sources)
+    ]
+    db = CountingDB(sources, n_sources * items_per_source if stored is None else stored)
+    handler = _CountingHandler()
+    root = logging.getLogger()
+    previous_level = root.level
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+    try:
+        manager = CollectorManager(db)
+        manager.collectors['synthetic'] = SyntheticCollector
+        handler.records = 0  # Collector loading is a fixed startup cost
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        results = manager.collect_all_sources()
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        root.removeHandler(handler)
+        root.setLevel(previous_level)
+
+    articles = n_sources * items_per_source
+    return {
+        'sources': n_sources,
+        'items': items_per_source,
+        'articles': results['total_articles'],
+        'seconds': elapsed,
+        'us_per_article': elapsed / articles * 1e6,
+        'peak_bytes': peak,
+        'peak_rss_kb': _peak_rss_kb(),
+        'db_calls': sum(db.calls.values()),
+        'calls': dict(db.calls),
+        'rows_written': db.rows_written,
+        'seed_pages': db.calls[('contents', 'select')],
+        'indexed': len(manager.dedup),
+        'log_records': handler.records,
+    }
+
+
+def run_scale_isolated(n_sources: int, items_per_source: int,
+                       stored: Optional[int] = None) -> Dict[str, Any]:
+    """run_scale in a fresh process, so peak_rss_kb covers this size alone"""
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as executor:
+        return executor.submit(run_scale, n_sources, items_per_source, stored).result()
+
+
+class TestCollectorManagerScale(unittest.TestCase):
+    BASE = (16, 16)
+    MORE_SOURCES = (64, 16)
+    MORE_ITEMS = (16, 64)
+
+    @classmethod
+    def sizes(cls):
+        return (cls.BASE, cls.MORE_SOURCES, cls.MORE_ITEMS)
+
+    @classmethod
+    def setUpClass(cls):
+        run_scale(2, 2)  # Warm imports and caches before timing
+        cls.runs = {size: run_scale(*size) for size in cls.sizes()}
+
+    def test_all_articles_written(self):
+        for (n, m), run in self.runs.items():
+            self.assertEqual(run['articles'], n * m)
+            self.assertEqual(run['rows_written'], n * m)
+
+    def test_db_round_trips_linear_in_sources_not_items(self):
+        max_seed_pages = math.ceil(CollectorManager.DEDUP_SEED_LIMIT / CollectorManager.DEDUP_PAGE_SIZE)
+        for (n, m), run in self.runs.items():
+            upserts_per_source = math.ceil(m / CollectorManager.SAVE_BATCH_SIZE)
+            self.assertGreaterEqual(run['seed_pages'], 1)
+            self.assertLessEqual(run['seed_pages'], max_seed_pages)
+            # sources lookup + dedup seed pages + per source: upsert batches and a sync update
+            self.assertLessEqual(run['db_calls'], 1 + run['seed_pages'] + n * (upserts_per_source + 1),
+                                 run['calls'])
+
+    def test_dedup_seed_bounded_by_limit_not_window(self):
+        limit = CollectorManager.DEDUP_SEED_LIMIT
+        run = run_scale(4, 4, stored=4 * limit)
+        self.assertEqual(run['seed_pages'], math.ceil(limit / CollectorManager.DEDUP_PAGE_SIZE))
+        self.assertEqual(run['indexed'], limit + 16)
+
+    def test_log_volume_independent_of_items(self):
+        for (n, m), run in self.runs.items():
+            self.assertLessEqual(run['log_records'], 2 * n + 5)
+
+    def test_time_per_article_does_not_grow(self):
+        base = self.runs[self.BASE]['us_per_article']
+        for size in (self.MORE_SOURCES, self.MORE_ITEMS):
+            # 4x the work; quadratic behaviour would show as ~4x per-article cost
+            self.assertLess(self.runs[size]['us_per_article'], 2.5 * base, self.runs[size])
+
+    def test_peak_memory_at_most_linear(self):
+        base = self.runs[self.BASE]
+        for size in (self.MORE_SOURCES, self.MORE_ITEMS):
+            run = self.runs[size]
+            per_article = run['peak_bytes'] / run['articles']
+            self.assertLess(per_article, 2 * base['peak_bytes'] / base['articles'], run)
+
+
+@unittest.skipUnless(os.environ.get('SCALE_TEST_LARGE'), 'set SCALE_TEST_LARGE=1 to run')
+class TestCollectorManagerScaleLarge(TestCollectorManagerScale):
+    """Thousands of sources; each size runs in its own process so RSS can be compared"""
+
+    BASE = (128, 16)
+    MID = (512, 16)
+    MORE_SOURCES = (2048, 16)
+    MORE_ITEMS = (128, 256)
+
+    @classmethod
+    def sizes(cls):
+        return (cls.BASE, cls.MID, cls.MORE_SOURCES, cls.MORE_ITEMS)
+
+    @classmethod
+    def setUpClass(cls):
+        cls.runs = {size: run_scale_isolated(*size) for size in cls.sizes()}
+
+    def test_peak_rss_at_most_linear(self):
+        # RSS includes the interpreter baseline, so compare the growth per added article
+        def growth(small, large):
+            small, large = self.runs[small], self.runs[large]
+            return (large['peak_rss_kb'] - small['peak_rss_kb']) / (large['articles'] - small['articles'])
+
+        self.assertLess(growth(self.MID, self.MORE_SOURCES), 1.5 * growth(self.BASE, self.MID),
+                        {size: self.runs[size]['peak_rss_kb'] for size in self.sizes()})
+
+
+if __name__ == '__main__':
+    sizes = [int(x) for x in sys.argv[1:3]] or [400, 100]
+    n_max, m_max = sizes[0], sizes[-1]
+    print(f"{'sources':>8} {'items':>6} {'seconds':>8} {'us/art':>8} {'peak MB':>8} {'rss MB':>7} "
+          f"{'db calls':>9} {'logs':>6}")
+    for n, m in [(n_max // 16, m_max // 4), (n_max // 4, m_max // 4), (n_max, m_max // 4),
+                 (n_max // 4, m_max), (n_max, m_max)]:
+        r = run_scale_isolated(max(n, 1), max(m, 1))
+        print(f"{r['sources']:>8} {r['items']:>6} {r['seconds']:>8.2f} {r['us_per_article']:>8.0f} "
+              f"{r['peak_bytes'] / 2**20:>8.1f} {r['peak_rss_kb'] / 1024:>7.0f} "
+              f"{r['db_calls']:>9} {r['log_records']:>6}")